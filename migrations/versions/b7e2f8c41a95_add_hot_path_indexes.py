@@ -0,0 +1,42 @@
+"""Add hot-path indexes
+
+Revision ID: b7e2f8c41a95
+Revises: ebc48a9a0fbe
+Create Date: 2026-08-26 10:12:31.204815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2f8c41a95'
+down_revision: Union[str, Sequence[str], None] = 'ebc48a9a0fbe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tool_calls_message_id', 'tool_calls', ['message_id'])
+    op.create_index('ix_conversations_agent_id', 'conversations', ['agent_id'])
+    op.create_index('ix_messages_conversation_seq', 'messages', ['conversation_id', 'sequence_num'])
+    op.create_index(
+        'ix_training_episodes_run_episode', 'training_episodes', ['training_run_id', 'episode_num']
+    )
+    op.create_index(
+        'ix_evaluation_results_run_test_case',
+        'evaluation_results',
+        ['evaluation_run_id', 'test_case_id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_evaluation_results_run_test_case', table_name='evaluation_results')
+    op.drop_index('ix_training_episodes_run_episode', table_name='training_episodes')
+    op.drop_index('ix_messages_conversation_seq', table_name='messages')
+    op.drop_index('ix_conversations_agent_id', table_name='conversations')
+    op.drop_index('ix_tool_calls_message_id', table_name='tool_calls')
@@ -0,0 +1,54 @@
+"""JSONB columns with GIN index on Postgres
+
+Revision ID: c9a4d16e03b7
+Revises: b7e2f8c41a95
+Create Date: 2026-08-26 10:41:07.583220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9a4d16e03b7'
+down_revision: Union[str, Sequence[str], None] = 'b7e2f8c41a95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs stored as JSON documents
+_JSON_COLUMNS = [
+    ('agents', 'config_json'),
+    ('conversations', 'metadata_json'),
+    ('tool_calls', 'arguments_json'),
+    ('test_cases', 'expected_tools_json'),
+    ('evaluation_results', 'tool_calls_json'),
+    ('evaluation_runs', 'aggregate_metrics_json'),
+    ('training_runs', 'config_json'),
+    ('training_episodes', 'states_json'),
+    ('training_episodes', 'actions_json'),
+    ('training_episodes', 'rewards_json'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite stores JSON as text either way; only Postgres needs the change
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column in _JSON_COLUMNS:
+        op.alter_column(table, column, type_=JSONB(), postgresql_using=f'{column}::jsonb')
+    op.create_index(
+        'ix_training_runs_config_gin', 'training_runs', ['config_json'], postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_training_runs_config_gin', table_name='training_runs')
+    for table, column in reversed(_JSON_COLUMNS):
+        op.alter_column(table, column, type_=sa.JSON(), postgresql_using=f'{column}::json')
@@ -0,0 +1,32 @@
+"""Keyset pagination indexes
+
+Revision ID: d5f8b72c19e4
+Revises: c9a4d16e03b7
+Create Date: 2026-08-26 14:02:33.917465
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f8b72c19e4'
+down_revision: Union[str, Sequence[str], None] = 'c9a4d16e03b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_agents_created_id', 'agents', ['created_at', 'id'])
+    op.create_index('ix_conversations_started_id', 'conversations', ['started_at', 'id'])
+    op.create_index('ix_test_cases_created_id', 'test_cases', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_test_cases_created_id', table_name='test_cases')
+    op.drop_index('ix_conversations_started_id', table_name='conversations')
+    op.drop_index('ix_agents_created_id', table_name='agents')
@@ -4,6 +4,7 @@ import os
 import json
 import uuid
 from typing import Optional, List, Dict, Any
+import httpx
 from openai import OpenAI
 from dotenv import load_dotenv
 
@@ -12,6 +13,22 @@ from ...tools import ToolRegistry
 
 load_dotenv()
 
+# One HTTP client shared by every agent in the process. Connections are
+# kept alive across requests, so after the first call agents skip TCP and
+# TLS setup, and an AgentPool shares a single connection pool instead of
+# opening one per agent.
+_shared_http_client: Optional[httpx.Client] = None
+
+
+def _get_shared_http_client() -> httpx.Client:
+    global _shared_http_client
+    if _shared_http_client is None:
+        _shared_http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            timeout=60.0,
+        )
+    return _shared_http_client
+
 
 class OpenAIAgent(BaseAgent, AgentCapabilities):
     """A chatbot agent using the OpenAI Responses API with function calling."""
@@ -23,7 +40,10 @@ class OpenAIAgent(BaseAgent, AgentCapabilities):
         temperature: Optional[float] = None,
         conversation_id: Optional[str] = None,
     ):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=_get_shared_http_client(),
+        )
         self._model = model or os.getenv("OPENAI_MODEL", "gpt-4o")
         temp_env = os.getenv("OPENAI_TEMPERATURE")
         self._temperature = (
@@ -263,7 +283,8 @@ class OpenAIAgent(BaseAgent, AgentCapabilities):
 
     def _run_tool(self, name: str, args: Dict[str, Any]) -> str:
         """Execute a tool and return its result."""
-        tool = self._tool_registry.get(name)
+        # The model can hallucinate tool names, so take the None path here
+        tool = self._tool_registry.get_or_none(name)
         if not tool:
             return f"Error: Tool '{name}' not found"
         try:
@@ -40,7 +40,8 @@ class Evaluator:
             task_type: Type of task matching
         
         Returns:
-            Metrics object with evaluation results
+            Metrics object with evaluation results; the agent's response is
+            available as metrics.response_text
         """
         # Reset agent for clean evaluation
         self.agent.reset(clear_conversation_id=True)
@@ -77,7 +78,8 @@ class Evaluator:
             task_success=task_success,
             tool_usage_efficiency=tool_usage_efficiency,
             response_quality=response_quality,
-            reward=reward
+            reward=reward,
+            response_text=response
         )
     
     def evaluate_batch(
@@ -1,11 +1,11 @@
 """Metrics for evaluating chatbot performance"""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     """Container for evaluation metrics"""
     
@@ -13,7 +13,8 @@ class Metrics:
     tool_usage_efficiency: float = 0.0  # 0.0 to 1.0
     response_quality: float = 0.0  # 0.0 to 1.0
     reward: float = 0.0  # Composite reward for RL
-    
+    response_text: Optional[str] = None  # Response the metrics were computed on
+
     def to_dict(self) -> Dict[str, float]:
         """Convert metrics to dictionary"""
         return {
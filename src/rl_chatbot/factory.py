@@ -8,6 +8,19 @@ from .agents.base import BaseAgent
 from .agents.openai import OpenAIAgent
 from .tools import ToolRegistry, create_default_tool_registry
 
+# Lazily-constructed default registry shared by all factories that don't
+# provide their own. Tools are stateless, so sharing one registry is safe
+# and avoids rebuilding the same tool set per factory.
+_DEFAULT_REGISTRY: Optional[ToolRegistry] = None
+
+
+def _get_default_registry() -> ToolRegistry:
+    """Get (or create) the process-wide default tool registry."""
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        _DEFAULT_REGISTRY = create_default_tool_registry()
+    return _DEFAULT_REGISTRY
+
 
 class AgentType(Enum):
     """Supported agent framework types."""
@@ -29,9 +42,10 @@ class AgentFactory:
         Initialize agent factory.
 
         Args:
-            tool_registry: Shared tool registry for all agents. If None, creates default registry.
+            tool_registry: Shared tool registry for all agents. If None, uses the
+                shared default registry.
         """
-        self.tool_registry = tool_registry or create_default_tool_registry()
+        self.tool_registry = tool_registry or _get_default_registry()
 
     @classmethod
     def register_agent_type(cls, agent_type: AgentType, agent_class: Type[BaseAgent]):
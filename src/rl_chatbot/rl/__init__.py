@@ -2,6 +2,7 @@
 
 from .trainer import RLTrainer
 from .reward import RewardFunction
+from .task_types import TaskType
 
-__all__ = ["RLTrainer", "RewardFunction"]
+__all__ = ["RLTrainer", "RewardFunction", "TaskType"]
 
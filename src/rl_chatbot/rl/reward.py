@@ -1,8 +1,13 @@
 """Reward function for RL training"""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from ..evaluation.metrics import MetricCalculator
 from ..agents.base import BaseAgent
+from .task_types import TaskType
+
+# MetricCalculator is stateless (all static methods), so one module-level
+# instance serves every RewardFunction instead of allocating one per object.
+_CALCULATOR = MetricCalculator()
 
 
 class RewardFunction:
@@ -32,16 +37,16 @@ class RewardFunction:
                 "tool_usage_efficiency": tool_efficiency_weight,
                 "response_quality": response_quality_weight
             }
-        
-        self.calculator = MetricCalculator()
-    
+
+        self.calculator = _CALCULATOR
+
     def compute_reward(
         self,
         agent: BaseAgent,
         user_input: str,
         expected_output: Optional[str] = None,
         expected_tools: Optional[List[str]] = None,
-        task_type: str = "exact_match"
+        task_type: Union[str, int, TaskType] = TaskType.EXACT_MATCH
     ) -> float:
         """
         Compute reward for a single interaction
@@ -51,11 +56,13 @@ class RewardFunction:
             user_input: User's input
             expected_output: Expected output (if available)
             expected_tools: Expected tools to call (if available)
-            task_type: Type of task matching
-        
+            task_type: Type of task matching; callers in hot loops can pass
+                a pre-resolved TaskType code to skip per-call string handling
+
         Returns:
             Reward value (typically between 0.0 and 1.0)
         """
+        task_type = TaskType.from_value(task_type)
         # Get the response from the agent
         final_response = agent.chat(user_input)
 
@@ -66,7 +73,7 @@ class RewardFunction:
         task_success = 0.0
         if expected_output:
             task_success = self.calculator.calculate_task_success(
-                expected_output, final_response, task_type
+                expected_output, final_response, task_type.label
             )
         elif not expected_output:
             # If no expected output, give partial credit for any response
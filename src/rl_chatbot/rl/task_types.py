@@ -0,0 +1,43 @@
+"""Integer task-type codes for reward dispatch"""
+
+from enum import IntEnum
+from typing import Union
+
+
+class TaskType(IntEnum):
+    """
+    Task matching strategies, encoded as ints.
+
+    Resolving the string form ("exact_match", etc.) once before a training
+    loop lets the hot path dispatch on integer comparison instead of
+    hashing the same short string on every reward computation.
+    """
+
+    EXACT_MATCH = 1
+    CONTAINS = 2
+    SEMANTIC = 3
+
+    @property
+    def label(self) -> str:
+        """The string form used by the metrics layer (e.g. "exact_match")."""
+        return self.name.lower()
+
+    @classmethod
+    def from_value(cls, value: Union[str, int, "TaskType"]) -> "TaskType":
+        """
+        Resolve a task type from its string name, int code, or enum value.
+
+        Unknown values fall back to EXACT_MATCH, matching the default
+        used throughout the training and evaluation code.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, int):
+            try:
+                return cls(value)
+            except ValueError:
+                return cls.EXACT_MATCH
+        try:
+            return cls[str(value).upper()]
+        except KeyError:
+            return cls.EXACT_MATCH
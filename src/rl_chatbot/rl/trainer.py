@@ -1,15 +1,40 @@
 """RL trainer for chatbot improvement"""
 
+import asyncio
 import os
-from typing import List, Dict, Any, Optional, Union
+import queue
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Any, Optional, Union
 from pathlib import Path
-import json
+import numpy as np
+import orjson
 from tqdm import tqdm
 
 from ..agents.base import BaseAgent
 from ..factory import AgentPool
 from ..evaluation.evaluator import Evaluator, MultiAgentEvaluator
 from .reward import RewardFunction
+from .task_types import TaskType
+
+
+@dataclass(slots=True)
+class EpisodeData:
+    """Collected states, actions, and rewards for one training episode."""
+
+    states: List[Dict[str, Any]] = field(default_factory=list)
+    actions: List[Any] = field(default_factory=list)
+    rewards: List[float] = field(default_factory=list)
+    test_cases: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view for JSON serialization (e.g. checkpoints)."""
+        return {
+            "states": self.states,
+            "actions": self.actions,
+            "rewards": self.rewards,
+            "test_cases": self.test_cases,
+        }
 
 
 class RLTrainer:
@@ -41,60 +66,118 @@ class RLTrainer:
         self.reward_function = reward_function or RewardFunction()
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(exist_ok=True)
-        
+
         # Training history
         self.training_history: List[Dict[str, Any]] = []
+
+        # Lazily-constructed evaluator, reused across evaluate() calls
+        self._evaluator: Optional[Evaluator] = None
     
     def collect_episode(
         self,
-        test_cases: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+        test_cases: List[Dict[str, Any]],
+        max_workers: int = 1
+    ) -> EpisodeData:
         """
         Collect one episode of interactions and rewards
-        
+
         Args:
             test_cases: Test cases to use for this episode
-        
+            max_workers: Number of concurrent test cases. Each LLM chat is a
+                blocking network round-trip, so running test cases on a thread
+                pool cuts episode wall-clock time roughly by this factor.
+
         Returns:
-            Dictionary with episode data (states, actions, rewards)
+            EpisodeData with states, actions, and rewards
         """
-        episode_data = {
-            "states": [],
-            "actions": [],
-            "rewards": [],
-            "test_cases": test_cases
-        }
-        
-        for test_case in test_cases:
-            # Reset agent
-            self.agent.reset()
-            
-            # Get state (conversation context)
-            state = {
-                "user_input": test_case["user_input"],
-                "conversation_id": self.agent.get_conversation_id()
-            }
-            
-            # Agent takes action (chats)
-            response = self.agent.chat(test_case["user_input"])
-
-            # Get tool calls from the agent
-            actions = self.agent.get_last_tool_calls()
-            
-            # Compute reward
-            reward = self.reward_function.compute_reward(
-                self.agent,
-                test_case["user_input"],
-                expected_output=test_case.get("expected_output"),
-                expected_tools=test_case.get("expected_tools"),
-                task_type=test_case.get("task_type", "exact_match")
+        episode_data = EpisodeData(test_cases=test_cases)
+
+        # Resolve task-type strings to int codes once per episode
+        resolved = [
+            (tc, TaskType.from_value(tc.get("task_type", TaskType.EXACT_MATCH)))
+            for tc in test_cases
+        ]
+
+        # Bind hot attributes to locals so the loop does LOAD_FAST instead
+        # of repeated LOAD_ATTR per test case
+        if max_workers <= 1:
+            agent = self.agent
+            run_test_case = self._run_test_case
+            results = [run_test_case(agent, tc, code) for tc, code in resolved]
+        else:
+            # A single agent holds mutable conversation state, so give each
+            # worker its own clone and recycle clones through a queue. Clones
+            # are rebuilt from config rather than copied: live agents hold
+            # client sockets and locks that deepcopy cannot pickle.
+            from ..factory import AgentFactory
+
+            config = self.agent.get_config()
+            factory = AgentFactory(
+                tool_registry=getattr(self.agent, "tool_registry", None)
             )
-            
-            episode_data["states"].append(state)
-            episode_data["actions"].append(actions)
-            episode_data["rewards"].append(reward)
-        
+            agent_pool: queue.Queue = queue.Queue()
+            for _ in range(min(max_workers, len(test_cases))):
+                agent_pool.put(factory.create_agent(
+                    agent_type=config.get("framework", "openai"),
+                    model=config.get("model"),
+                    temperature=config.get("temperature"),
+                ))
+
+            def _run_one(item):
+                test_case, task_code = item
+                agent = agent_pool.get()
+                try:
+                    return self._run_test_case(agent, test_case, task_code)
+                finally:
+                    agent_pool.put(agent)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_run_one, resolved))
+
+        states = episode_data.states
+        actions_list = episode_data.actions
+        rewards = episode_data.rewards
+        for state, actions, reward in results:
+            states.append(state)
+            actions_list.append(actions)
+            rewards.append(reward)
+
         return episode_data
+
+    def _run_test_case(
+        self,
+        agent: BaseAgent,
+        test_case: Dict[str, Any],
+        task_type: Optional[TaskType] = None
+    ) -> tuple:
+        """Run a single test case and return (state, actions, reward)."""
+        if task_type is None:
+            task_type = TaskType.from_value(test_case.get("task_type", TaskType.EXACT_MATCH))
+        # Reset agent
+        agent.reset()
+
+        # Get state (conversation context)
+        state = {
+            "user_input": test_case["user_input"],
+            "conversation_id": agent.get_conversation_id()
+        }
+
+        # Agent takes action (chats)
+        response = agent.chat(test_case["user_input"])
+
+        # Get tool calls from the agent
+        actions = agent.get_last_tool_calls()
+
+        # Compute reward
+        reward = self.reward_function.compute_reward(
+            agent,
+            test_case["user_input"],
+            expected_output=test_case.get("expected_output"),
+            expected_tools=test_case.get("expected_tools"),
+            task_type=task_type
+        )
+
+        return state, actions, reward
     
     def train_step(
         self,
@@ -113,19 +196,21 @@ class RLTrainer:
         """
         # Collect episode data
         episode_data = self.collect_episode(test_cases)
-        
-        # Calculate metrics
-        avg_reward = sum(episode_data["rewards"]) / len(episode_data["rewards"])
-        
+
+        # Calculate metrics in a single vectorized pass
+        rewards = np.asarray(episode_data.rewards, dtype=np.float32)
+        total_reward = float(rewards.sum())
+        avg_reward = total_reward / rewards.size
+
         # TODO: In a full implementation, you would:
         # 1. Update the policy network using the collected data
         # 2. Use an RL algorithm (PPO, DQN, etc.) to update parameters
         # 3. Save updated model
-        
+
         step_results = {
             "episode": episode_num,
             "avg_reward": avg_reward,
-            "total_reward": sum(episode_data["rewards"]),
+            "total_reward": total_reward,
             "num_test_cases": len(test_cases)
         }
         
@@ -137,24 +222,37 @@ class RLTrainer:
         self,
         test_cases: List[Dict[str, Any]],
         num_episodes: int = 10,
-        verbose: bool = True
+        verbose: bool = True,
+        on_episode_end: Optional[Callable[[Dict[str, Any]], None]] = None
     ):
         """
         Train the chatbot using RL
-        
+
         Args:
             test_cases: Test cases to use for training
             num_episodes: Number of training episodes
             verbose: Whether to show progress
+            on_episode_end: Optional callback invoked with each episode's step
+                results. Lets callers (e.g. the API server) buffer episodes
+                and batch-persist them instead of writing one row at a time.
         """
         print(f"Starting RL training for {num_episodes} episodes...")
-        
-        iterator = tqdm(range(num_episodes)) if verbose else range(num_episodes)
-        
+
+        iterator = (
+            tqdm(range(num_episodes), mininterval=0.5, smoothing=0.1)
+            if verbose
+            else range(num_episodes)
+        )
+
         for episode in iterator:
             step_results = self.train_step(test_cases, episode)
-            
-            if verbose:
+
+            if on_episode_end is not None:
+                on_episode_end(step_results)
+
+            # Refresh the description periodically rather than every episode;
+            # tqdm throttles redraws but the f-string build still runs
+            if verbose and (episode % 10 == 0 or episode == num_episodes - 1):
                 iterator.set_description(
                     f"Episode {episode+1}/{num_episodes} - "
                     f"Avg Reward: {step_results['avg_reward']:.3f}"
@@ -176,8 +274,9 @@ class RLTrainer:
         Returns:
             Evaluation results
         """
-        evaluator = Evaluator(self.agent)
-        return evaluator.evaluate_batch(test_cases, verbose=True)
+        if self._evaluator is None:
+            self._evaluator = Evaluator(self.agent)
+        return self._evaluator.evaluate_batch(test_cases, verbose=True)
     
     def save_checkpoint(self, episode: int):
         """Save training checkpoint"""
@@ -192,20 +291,51 @@ class RLTrainer:
             }
         }
         
-        with open(checkpoint_path, 'w') as f:
-            json.dump(checkpoint_data, f, indent=2)
-        
+        # orjson encodes in C and returns bytes, so the dump is a single write
+        checkpoint_path.write_bytes(orjson.dumps(checkpoint_data, option=orjson.OPT_INDENT_2))
+
         print(f"Checkpoint saved to {checkpoint_path}")
-    
+
     def load_checkpoint(self, checkpoint_path: str):
         """Load training checkpoint"""
-        with open(checkpoint_path, 'r') as f:
-            checkpoint_data = json.load(f)
-        
+        checkpoint_data = orjson.loads(Path(checkpoint_path).read_bytes())
+
         self.training_history = checkpoint_data.get("training_history", [])
         print(f"Checkpoint loaded from {checkpoint_path}")
 
 
+def _train_one_agent(
+    agent_config: Dict[str, Any],
+    reward_weights: Dict[str, float],
+    test_cases: List[Dict[str, Any]],
+    num_episodes: int,
+    checkpoint_dir: str
+) -> List[Dict[str, Any]]:
+    """
+    Rebuild an agent from its config and run a full training loop.
+
+    Module-level (not a method) so it is picklable for ProcessPoolExecutor.
+    Agents are serialized as lightweight configs rather than live objects
+    to avoid pickling client sockets.
+    """
+    from ..factory import AgentFactory
+
+    factory = AgentFactory()
+    agent = factory.create_agent(
+        agent_type=agent_config.get("framework", "openai"),
+        model=agent_config.get("model"),
+        temperature=agent_config.get("temperature"),
+        conversation_id=agent_config.get("conversation_id"),
+    )
+    trainer = RLTrainer(
+        agent=agent,
+        reward_function=RewardFunction(weights=reward_weights),
+        checkpoint_dir=checkpoint_dir
+    )
+    trainer.train(test_cases, num_episodes=num_episodes, verbose=False)
+    return trainer.training_history
+
+
 class MultiAgentRLTrainer:
     """
     Trainer for multiple agents with shared tools.
@@ -237,6 +367,9 @@ class MultiAgentRLTrainer:
             self.agent_ids = [agent.get_conversation_id() for agent in agents]
             self.agent_pool = None
 
+        # Index for O(1) lookup by agent ID
+        self._agent_by_id: Dict[str, BaseAgent] = dict(zip(self.agent_ids, self.agents))
+
         self.reward_function = reward_function or RewardFunction()
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(exist_ok=True)
@@ -246,11 +379,15 @@ class MultiAgentRLTrainer:
             agent_id: [] for agent_id in self.agent_ids
         }
 
+        # Lazily-constructed evaluator, reused across compare_agents() calls
+        self._multi_evaluator: Optional[MultiAgentEvaluator] = None
+
     def train_all_agents(
         self,
         test_cases: List[Dict[str, Any]],
         num_episodes: int = 10,
-        verbose: bool = True
+        verbose: bool = True,
+        num_workers: Optional[int] = None
     ):
         """
         Train all agents independently.
@@ -259,7 +396,30 @@ class MultiAgentRLTrainer:
             test_cases: Test cases to use for training
             num_episodes: Number of training episodes per agent
             verbose: Whether to show progress
+            num_workers: If > 1, train agents in parallel across processes.
+                Each agent's training loop is independent (separate checkpoint
+                dir and history), so they parallelize cleanly.
         """
+        if num_workers and num_workers > 1:
+            with ProcessPoolExecutor(max_workers=num_workers) as pool:
+                futures = {
+                    pool.submit(
+                        _train_one_agent,
+                        agent.get_config(),
+                        self.reward_function.weights,
+                        test_cases,
+                        num_episodes,
+                        str(self.checkpoint_dir / agent_id),
+                    ): agent_id
+                    for agent_id, agent in zip(self.agent_ids, self.agents)
+                }
+                for future in as_completed(futures):
+                    agent_id = futures[future]
+                    self.training_histories[agent_id] = future.result()
+                    if verbose:
+                        print(f"Finished training agent: {agent_id}")
+            return
+
         for agent_id, agent in zip(self.agent_ids, self.agents):
             if verbose:
                 print(f"\n{'='*60}")
@@ -279,6 +439,46 @@ class MultiAgentRLTrainer:
             # Store history
             self.training_histories[agent_id] = trainer.training_history
 
+    async def train_all_agents_async(
+        self,
+        test_cases: List[Dict[str, Any]],
+        num_episodes: int = 10,
+        max_parallel_agents: int = 4
+    ):
+        """
+        Train all agents concurrently on the event loop.
+
+        Each agent's training loop is independent and dominated by LLM I/O,
+        so overlapping them gives near-linear speedup across agents without
+        the pickling cost of a process pool. Blocking agent.chat calls run
+        on worker threads; the semaphore caps concurrent agents to stay
+        under provider rate limits.
+
+        Args:
+            test_cases: Test cases to use for training
+            num_episodes: Number of training episodes per agent
+            max_parallel_agents: Maximum agents training at once
+        """
+        semaphore = asyncio.Semaphore(max_parallel_agents)
+
+        async def _run(agent_id: str, agent: BaseAgent):
+            async with semaphore:
+                trainer = RLTrainer(
+                    agent=agent,
+                    reward_function=self.reward_function,
+                    checkpoint_dir=str(self.checkpoint_dir / agent_id)
+                )
+                await asyncio.to_thread(
+                    trainer.train, test_cases, num_episodes, False
+                )
+                return agent_id, trainer.training_history
+
+        results = await asyncio.gather(
+            *[_run(agent_id, agent) for agent_id, agent in zip(self.agent_ids, self.agents)]
+        )
+        for agent_id, history in results:
+            self.training_histories[agent_id] = history
+
     def compare_agents(
         self,
         test_cases: List[Dict[str, Any]],
@@ -294,8 +494,9 @@ class MultiAgentRLTrainer:
         Returns:
             Comparison results with rankings
         """
-        evaluator = MultiAgentEvaluator(self.agents)
-        return evaluator.compare_agents(test_cases, verbose=verbose)
+        if self._multi_evaluator is None:
+            self._multi_evaluator = MultiAgentEvaluator(self.agents)
+        return self._multi_evaluator.compare_agents(test_cases, verbose=verbose)
 
     def get_best_agent(
         self,
@@ -315,10 +516,10 @@ class MultiAgentRLTrainer:
         comparison = self.compare_agents(test_cases, verbose=False)
         best_agent_id = comparison["best_agent"].get(metric, comparison["best_overall"])
 
-        # Find the agent
-        for agent_id, agent in zip(self.agent_ids, self.agents):
-            if agent_id == best_agent_id:
-                return agent_id, agent
+        # Look up the agent by ID
+        agent = self._agent_by_id.get(best_agent_id)
+        if agent is not None:
+            return best_agent_id, agent
 
         # Fallback to first agent
         return self.agent_ids[0], self.agents[0]
@@ -335,8 +536,7 @@ class MultiAgentRLTrainer:
                 "training_history": history,
             }
 
-            with open(checkpoint_path, 'w') as f:
-                json.dump(checkpoint_data, f, indent=2)
+            checkpoint_path.write_bytes(orjson.dumps(checkpoint_data, option=orjson.OPT_INDENT_2))
 
             print(f"Checkpoint saved for {agent_id}: {checkpoint_path}")
 
@@ -1,6 +1,5 @@
 """Server configuration using Pydantic Settings."""
 
-from functools import lru_cache
 from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -12,11 +11,22 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite+aiosqlite:///./data/rl_chatbot.db"
 
+    # Connection pool tuning. pre-ping is off by default: it costs a
+    # SELECT 1 round-trip per checkout and buys nothing on SQLite.
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 3600
+    db_pool_pre_ping: bool = False
+
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
 
+    # Cap on evaluation/training runs executing at once; further runs
+    # queue on a semaphore so a burst of starts can't exhaust memory
+    max_concurrent_runs: int = 4
+
     # OpenAI (inherited from existing config)
     openai_api_key: Optional[str] = None
     openai_model: str = "gpt-4o"
@@ -29,10 +39,21 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
 
-@lru_cache
+# Settings are resolved once at import time; FastAPI dependencies then get a
+# plain attribute read instead of lru_cache's lock + dict lookup per request.
+SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the settings instance."""
+    return SETTINGS
+
+
+def _set_settings(settings: Settings):
+    """Swap the settings instance (for tests)."""
+    global SETTINGS
+    SETTINGS = settings
@@ -2,6 +2,7 @@
 
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
@@ -11,11 +12,28 @@ from .config import get_settings
 settings = get_settings()
 
 # Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True,
-)
+_engine_kwargs = {
+    "echo": settings.debug,
+    "future": True,
+    "pool_recycle": settings.db_pool_recycle,
+    "pool_pre_ping": settings.db_pool_pre_ping,
+}
+# In-memory SQLite uses StaticPool, which has no sizing knobs
+if ":memory:" not in settings.database_url:
+    _engine_kwargs["pool_size"] = settings.db_pool_size
+    _engine_kwargs["max_overflow"] = settings.db_max_overflow
+
+engine = create_async_engine(settings.database_url, **_engine_kwargs)
+
+if settings.database_url.startswith("sqlite"):
+    # WAL lets readers proceed during writes and NORMAL avoids an fsync per
+    # commit, so batched episode/message inserts don't serialize on disk.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
 
 # Create async session factory
 async_session = sessionmaker(
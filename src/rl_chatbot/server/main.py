@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .config import get_settings
 from .database import init_db
@@ -28,6 +29,9 @@ app = FastAPI(
     description="API for managing, evaluating, and training RL chatbot agents",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson encodes UUIDs/datetimes natively in C, which matters for the
+    # JSON-heavy conversation/evaluation/training read endpoints
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -60,6 +64,14 @@ def run():
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        # Compress WebSocket frames: chat responses and progress updates are
+        # repetitive JSON, so permessage-deflate cuts bytes on the wire
+        ws="websockets",
+        ws_per_message_deflate=True,
+        # Protocol-level ping/pong keeps idle progress sockets alive without
+        # the handlers having to read and discard client frames
+        ws_ping_interval=20,
+        ws_ping_timeout=20,
     )
 
 
@@ -0,0 +1,45 @@
+"""Shared helpers for database models."""
+
+import secrets
+import time
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+_UTC = timezone.utc
+
+# JSONB on Postgres: stored binary (no re-parse on read) and GIN-indexable
+# for queries into the document. Plain JSON everywhere else.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+def uuid7() -> UUID:
+    """Return a time-ordered UUIDv7.
+
+    Layout per RFC 9562: 48-bit unix millisecond timestamp, version and
+    variant bits, 74 random bits. The time prefix makes primary keys
+    near-sequential, so B-tree inserts hit hot index pages instead of
+    thrashing random leaves the way uuid4 keys do.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    value = (
+        (ts_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | secrets.randbits(12) << 64
+        | 0b10 << 62
+        | secrets.randbits(62)
+    )
+    return UUID(int=value)
+
+
+def utcnow() -> datetime:
+    """Return a timezone-aware UTC timestamp.
+
+    Replaces the deprecated ``datetime.utcnow`` default factory. The tzinfo
+    is bound once at module level, so bulk inserts (training episodes,
+    messages) don't pay a timezone lookup per row, and values come back
+    tz-aware without naive-datetime coercion.
+    """
+    return datetime.now(_UTC)
@@ -2,9 +2,12 @@
 
 from datetime import datetime
 from typing import Optional, List, Any, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlmodel import SQLModel, Field, Relationship, Column, JSON
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field, Relationship, Column
+
+from ._common import JSONVariant, utcnow, uuid7
 
 if TYPE_CHECKING:
     from .conversation import Conversation
@@ -20,7 +23,7 @@ class AgentBase(SQLModel):
     model: str = Field(default="gpt-4o", max_length=100)
     temperature: float = Field(default=1.0)
     system_prompt: Optional[str] = Field(default=None)
-    config_json: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    config_json: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSONVariant))
     is_active: bool = Field(default=True)
 
 
@@ -28,9 +31,11 @@ class Agent(AgentBase, table=True):
     """Database model for agents."""
 
     __tablename__ = "agents"
+    # Composite index backing keyset pagination on (created_at, id)
+    __table_args__ = (Index("ix_agents_created_id", "created_at", "id"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    created_at: datetime = Field(default_factory=utcnow)
     updated_at: Optional[datetime] = Field(default=None)
 
     # Relationships
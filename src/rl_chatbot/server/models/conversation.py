@@ -2,9 +2,12 @@
 
 from datetime import datetime
 from typing import Optional, List, Any, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlmodel import SQLModel, Field, Relationship, Column, JSON
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field, Relationship, Column
+
+from ._common import JSONVariant, utcnow, uuid7
 
 if TYPE_CHECKING:
     from .agent import Agent
@@ -14,7 +17,7 @@ class ToolCallBase(SQLModel):
     """Base tool call model."""
 
     tool_name: str = Field(max_length=100)
-    arguments_json: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    arguments_json: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSONVariant))
     result: Optional[str] = None
     duration_ms: Optional[int] = None
 
@@ -24,9 +27,9 @@ class ToolCall(ToolCallBase, table=True):
 
     __tablename__ = "tool_calls"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    message_id: UUID = Field(foreign_key="messages.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    message_id: UUID = Field(foreign_key="messages.id", index=True)
+    created_at: datetime = Field(default_factory=utcnow)
 
     # Relationships
     message: "Message" = Relationship(back_populates="tool_calls")
@@ -44,10 +47,13 @@ class Message(MessageBase, table=True):
     """Database model for messages."""
 
     __tablename__ = "messages"
+    # Matches the hot query shape: messages for a conversation ordered by
+    # sequence_num, so SQLite can seek and skip the sort
+    __table_args__ = (Index("ix_messages_conversation_seq", "conversation_id", "sequence_num"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     conversation_id: UUID = Field(foreign_key="conversations.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
     # Relationships
     conversation: "Conversation" = Relationship(back_populates="messages")
@@ -57,22 +63,27 @@ class Message(MessageBase, table=True):
 class ConversationBase(SQLModel):
     """Base conversation model."""
 
-    metadata_json: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    metadata_json: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSONVariant))
 
 
 class Conversation(ConversationBase, table=True):
     """Database model for conversations."""
 
     __tablename__ = "conversations"
+    # Composite index backing keyset pagination on (started_at, id)
+    __table_args__ = (Index("ix_conversations_started_id", "started_at", "id"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    agent_id: UUID = Field(foreign_key="agents.id")
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    agent_id: UUID = Field(foreign_key="agents.id", index=True)
+    started_at: datetime = Field(default_factory=utcnow)
     ended_at: Optional[datetime] = None
 
     # Relationships
     agent: "Agent" = Relationship(back_populates="conversations")
-    messages: List[Message] = Relationship(back_populates="conversation")
+    messages: List[Message] = Relationship(
+        back_populates="conversation",
+        sa_relationship_kwargs={"order_by": "Message.sequence_num"},
+    )
 
 
 class MessageRead(MessageBase):
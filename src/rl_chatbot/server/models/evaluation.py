@@ -2,9 +2,12 @@
 
 from datetime import datetime
 from typing import Optional, List, Any, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlmodel import SQLModel, Field, Relationship, Column, JSON
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field, Relationship, Column
+
+from ._common import JSONVariant, utcnow, uuid7
 
 if TYPE_CHECKING:
     from .agent import Agent
@@ -16,7 +19,7 @@ class TestCaseBase(SQLModel):
     name: Optional[str] = Field(default=None, max_length=255)
     user_input: str
     expected_output: Optional[str] = None
-    expected_tools_json: Optional[List[str]] = Field(default=None, sa_column=Column(JSON))
+    expected_tools_json: Optional[List[str]] = Field(default=None, sa_column=Column(JSONVariant))
     task_type: str = Field(default="exact_match", max_length=50)
     is_active: bool = Field(default=True)
 
@@ -25,9 +28,11 @@ class TestCase(TestCaseBase, table=True):
     """Database model for test cases."""
 
     __tablename__ = "test_cases"
+    # Composite index backing keyset pagination on (created_at, id)
+    __table_args__ = (Index("ix_test_cases_created_id", "created_at", "id"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    created_at: datetime = Field(default_factory=utcnow)
 
 
 class TestCaseCreate(TestCaseBase):
@@ -51,15 +56,16 @@ class EvaluationResultBase(SQLModel):
     response_quality: float
     reward: float
     response_text: Optional[str] = None
-    tool_calls_json: Optional[List[dict[str, Any]]] = Field(default=None, sa_column=Column(JSON))
+    tool_calls_json: Optional[List[dict[str, Any]]] = Field(default=None, sa_column=Column(JSONVariant))
 
 
 class EvaluationResult(EvaluationResultBase, table=True):
     """Database model for evaluation results."""
 
     __tablename__ = "evaluation_results"
+    __table_args__ = (Index("ix_evaluation_results_run_test_case", "evaluation_run_id", "test_case_id"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     evaluation_run_id: UUID = Field(foreign_key="evaluation_runs.id")
     test_case_id: UUID = Field(foreign_key="test_cases.id")
 
@@ -79,11 +85,11 @@ class EvaluationRun(EvaluationRunBase, table=True):
 
     __tablename__ = "evaluation_runs"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     agent_id: UUID = Field(foreign_key="agents.id")
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=utcnow)
     completed_at: Optional[datetime] = None
-    aggregate_metrics_json: Optional[dict[str, float]] = Field(default=None, sa_column=Column(JSON))
+    aggregate_metrics_json: Optional[dict[str, float]] = Field(default=None, sa_column=Column(JSONVariant))
 
     # Relationships
     agent: "Agent" = Relationship(back_populates="evaluation_runs")
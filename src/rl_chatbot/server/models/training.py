@@ -2,9 +2,12 @@
 
 from datetime import datetime
 from typing import Optional, List, Any, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlmodel import SQLModel, Field, Relationship, Column, JSON
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field, Relationship, Column
+
+from ._common import JSONVariant, utcnow, uuid7
 
 if TYPE_CHECKING:
     from .agent import Agent
@@ -17,19 +20,20 @@ class TrainingEpisodeBase(SQLModel):
     avg_reward: float
     total_reward: float
     num_test_cases: int
-    states_json: Optional[List[dict[str, Any]]] = Field(default=None, sa_column=Column(JSON))
-    actions_json: Optional[List[dict[str, Any]]] = Field(default=None, sa_column=Column(JSON))
-    rewards_json: Optional[List[float]] = Field(default=None, sa_column=Column(JSON))
+    states_json: Optional[List[dict[str, Any]]] = Field(default=None, sa_column=Column(JSONVariant))
+    actions_json: Optional[List[dict[str, Any]]] = Field(default=None, sa_column=Column(JSONVariant))
+    rewards_json: Optional[List[float]] = Field(default=None, sa_column=Column(JSONVariant))
 
 
 class TrainingEpisode(TrainingEpisodeBase, table=True):
     """Database model for training episodes."""
 
     __tablename__ = "training_episodes"
+    __table_args__ = (Index("ix_training_episodes_run_episode", "training_run_id", "episode_num"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     training_run_id: UUID = Field(foreign_key="training_runs.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
     # Relationships
     training_run: "TrainingRun" = Relationship(back_populates="episodes")
@@ -42,7 +46,7 @@ class TrainingRunBase(SQLModel):
     num_episodes: int
     current_episode: int = Field(default=0)
     final_avg_reward: Optional[float] = None
-    config_json: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    config_json: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSONVariant))
 
 
 class TrainingRun(TrainingRunBase, table=True):
@@ -50,14 +54,17 @@ class TrainingRun(TrainingRunBase, table=True):
 
     __tablename__ = "training_runs"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     agent_id: UUID = Field(foreign_key="agents.id")
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=utcnow)
     completed_at: Optional[datetime] = None
 
     # Relationships
     agent: "Agent" = Relationship(back_populates="training_runs")
-    episodes: List[TrainingEpisode] = Relationship(back_populates="training_run")
+    episodes: List[TrainingEpisode] = Relationship(
+        back_populates="training_run",
+        sa_relationship_kwargs={"order_by": "TrainingEpisode.episode_num"},
+    )
 
 
 class TrainingEpisodeRead(TrainingEpisodeBase):
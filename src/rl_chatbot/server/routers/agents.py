@@ -1,9 +1,10 @@
 """Agent CRUD endpoints."""
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_session
@@ -33,10 +34,26 @@ async def list_agents(
     skip: int = 0,
     limit: int = 100,
     active_only: bool = True,
+    cursor_created_at: Optional[datetime] = Query(
+        None, description="Keyset cursor: created_at of the last item of the previous page"
+    ),
+    cursor_id: Optional[UUID] = Query(
+        None, description="Keyset cursor: id of the last item of the previous page"
+    ),
     service: AgentService = Depends(get_agent_service),
 ):
-    """List all agents."""
-    agents = await service.list(skip=skip, limit=limit, active_only=active_only)
+    """List all agents.
+
+    Pass the last item's created_at and id as the cursor for the next
+    page to avoid OFFSET costs on deep pages.
+    """
+    agents = await service.list(
+        skip=skip,
+        limit=limit,
+        active_only=active_only,
+        cursor_created_at=cursor_created_at,
+        cursor_id=cursor_id,
+    )
     return agents
 
 
@@ -6,9 +6,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_session, async_session
+from ..database import get_session
 from ..schemas.chat import ChatRequest, ChatResponse
-from ..services.chat_service import ChatService, get_chat_service
+from ..services.chat_service import get_chat_service
 from ..websocket.chat import ChatWebSocketHandler
 
 router = APIRouter()
@@ -20,9 +20,9 @@ async def chat(
     session: AsyncSession = Depends(get_session),
 ):
     """Send a message to an agent and get a response."""
-    service = get_chat_service(session)
+    service = get_chat_service()
     try:
-        response = await service.chat(request)
+        response = await service.chat(session, request)
         return response
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -48,6 +48,7 @@ async def websocket_chat(
     - {"type": "response", "conversation_id": "...", "response": "...", ...} - Agent response
     - {"type": "error", "error": "..."} - Error occurred
     """
-    async with async_session() as session:
-        handler = ChatWebSocketHandler(session)
-        await handler.handle(websocket, agent_id, conversation_id)
+    # The handler acquires a session per message, so an idle connection
+    # does not hold a pooled DB connection for its whole lifetime
+    handler = ChatWebSocketHandler()
+    await handler.handle(websocket, agent_id, conversation_id)
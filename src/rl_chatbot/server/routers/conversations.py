@@ -1,13 +1,16 @@
 """Conversation endpoints."""
 
-from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
+from datetime import datetime
+
 from sqlmodel import select, func
+from sqlalchemy import delete, tuple_, update
 
 from ..database import get_session
 from ..models import Conversation, Message, ToolCall
@@ -15,65 +18,97 @@ from ..schemas.chat import ConversationRead, ConversationListItem, MessageRead,
 
 router = APIRouter()
 
+# Built once: reusing the compiled serializer and returning its bytes
+# directly skips FastAPI's per-response validation and encoding pass
+_CONVERSATION_LIST_ADAPTER = TypeAdapter(List[ConversationListItem])
 
-@router.get("", response_model=List[ConversationListItem])
+
+@router.get("", response_model=None)
 async def list_conversations(
     agent_id: Optional[UUID] = Query(None, description="Filter by agent ID"),
     skip: int = 0,
     limit: int = 100,
+    cursor_started_at: Optional[datetime] = Query(
+        None, description="Keyset cursor: started_at of the last item of the previous page"
+    ),
+    cursor_id: Optional[UUID] = Query(
+        None, description="Keyset cursor: id of the last item of the previous page"
+    ),
     session: AsyncSession = Depends(get_session),
 ):
-    """List all conversations with message counts."""
-    # Build query
-    query = select(Conversation)
+    """List all conversations with message counts.
+
+    Pass the last item's started_at and id as the cursor for the next
+    page; keyset pagination stays O(limit) at any depth, where OFFSET
+    scans and discards every skipped row.
+    """
+    # Fetch conversations and message counts in one round-trip via an
+    # outer join + group by, instead of one COUNT query per conversation
+    query = select(Conversation, func.count(Message.id)).outerjoin(
+        Message, Message.conversation_id == Conversation.id
+    )
     if agent_id:
         query = query.where(Conversation.agent_id == agent_id)
-    query = query.offset(skip).limit(limit).order_by(Conversation.started_at.desc())
+    if cursor_started_at is not None and cursor_id is not None:
+        query = query.where(
+            tuple_(Conversation.started_at, Conversation.id) < (cursor_started_at, cursor_id)
+        )
+    else:
+        query = query.offset(skip)
+    query = (
+        query.group_by(Conversation.id)
+        .order_by(Conversation.started_at.desc(), Conversation.id.desc())
+        .limit(limit)
+    )
 
     result = await session.execute(query)
-    conversations = result.scalars().all()
 
-    # Get message counts
-    items = []
-    for conv in conversations:
-        count_result = await session.execute(
-            select(func.count(Message.id)).where(Message.conversation_id == conv.id)
-        )
-        message_count = count_result.scalar() or 0
-
-        items.append(
-            ConversationListItem(
-                id=conv.id,
-                agent_id=conv.agent_id,
-                started_at=conv.started_at,
-                ended_at=conv.ended_at,
-                message_count=message_count,
-            )
+    # model_construct skips validation; the rows come straight from the DB
+    items = [
+        ConversationListItem.model_construct(
+            id=conv.id,
+            agent_id=conv.agent_id,
+            started_at=conv.started_at,
+            ended_at=conv.ended_at,
+            message_count=message_count,
         )
-
-    return items
+        for conv, message_count in result.all()
+    ]
+    return Response(
+        content=_CONVERSATION_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
 
 
-@router.get("/{conversation_id}", response_model=ConversationRead)
+@router.get("/{conversation_id}", response_model=ConversationRead, response_model_exclude_unset=True)
 async def get_conversation(
     conversation_id: UUID,
     session: AsyncSession = Depends(get_session),
 ):
     """Get a conversation with all its messages and tool calls."""
-    # Get conversation with messages eagerly loaded
+    # One joined query with row deduplication instead of three selectin
+    # round-trips. joinedload wins while conversations stay below roughly
+    # 50 messages (the duplicated parent columns stay cheaper than two
+    # extra network turnarounds); revisit selectinload past that point.
     result = await session.execute(
         select(Conversation)
         .where(Conversation.id == conversation_id)
-        .options(selectinload(Conversation.messages).selectinload(Message.tool_calls))
+        # raiseload pins the loading strategy: any relationship not eagerly
+        # loaded above fails fast instead of lazy-loading under AsyncSession
+        .options(
+            joinedload(Conversation.messages).joinedload(Message.tool_calls),
+            raiseload("*"),
+        )
     )
-    conversation = result.scalar_one_or_none()
+    conversation = result.unique().scalar_one_or_none()
 
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Build response with messages and tool calls
+    # Build response with messages and tool calls; the messages relationship
+    # is ordered by sequence_num in SQL, so no Python sort is needed
     messages_read = []
-    for msg in sorted(conversation.messages, key=lambda m: m.sequence_num):
+    for msg in conversation.messages:
         tool_calls_read = [
             ToolCallRead(
                 id=tc.id,
@@ -113,16 +148,20 @@ async def delete_conversation(
     session: AsyncSession = Depends(get_session),
 ):
     """Delete a conversation and all its messages."""
+    # Bulk-delete children then the conversation: three statements total,
+    # no existence pre-SELECT and no ORM cascade loading rows into memory
+    message_ids = select(Message.id).where(Message.conversation_id == conversation_id)
+    await session.execute(delete(ToolCall).where(ToolCall.message_id.in_(message_ids)))
+    await session.execute(delete(Message).where(Message.conversation_id == conversation_id))
     result = await session.execute(
-        select(Conversation).where(Conversation.id == conversation_id)
+        delete(Conversation)
+        .where(Conversation.id == conversation_id)
+        .returning(Conversation.id)
     )
-    conversation = result.scalar_one_or_none()
 
-    if not conversation:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Delete associated messages and tool calls (cascade)
-    await session.delete(conversation)
     await session.commit()
     return None
 
@@ -133,17 +172,18 @@ async def end_conversation(
     session: AsyncSession = Depends(get_session),
 ):
     """Mark a conversation as ended."""
+    # Single UPDATE ... RETURNING; the timestamp is computed by the database
+    # atomically with the write instead of in Python
     result = await session.execute(
-        select(Conversation).where(Conversation.id == conversation_id)
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(ended_at=func.now())
+        .returning(Conversation.id)
     )
-    conversation = result.scalar_one_or_none()
 
-    if not conversation:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    conversation.ended_at = datetime.utcnow()
-    session.add(conversation)
     await session.commit()
-    await session.refresh(conversation)
-
-    return {"status": "ended", "conversation_id": str(conversation.id)}
+    # orjson renders UUIDs natively; no str() pass needed
+    return {"status": "ended", "conversation_id": conversation_id}
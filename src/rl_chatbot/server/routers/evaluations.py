@@ -1,9 +1,13 @@
 """Evaluation endpoints."""
 
+import asyncio
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, WebSocket, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_session, async_session
@@ -18,6 +22,13 @@ from ..websocket.manager import manager
 
 router = APIRouter()
 
+# Max progress updates coalesced into one WebSocket frame
+PROGRESS_BATCH_MAX = 64
+
+# Built once: reusing the compiled serializer and returning its bytes
+# directly skips FastAPI's per-response validation and encoding pass
+_RUN_LIST_ADAPTER = TypeAdapter(List[EvaluationRunListItem])
+
 
 @router.post("", response_model=EvaluationRunListItem)
 async def start_evaluation(
@@ -45,7 +56,7 @@ async def start_evaluation(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("", response_model=List[EvaluationRunListItem])
+@router.get("", response_model=None)
 async def list_evaluations(
     agent_id: Optional[UUID] = Query(None, description="Filter by agent ID"),
     skip: int = 0,
@@ -55,8 +66,9 @@ async def list_evaluations(
     """List evaluation runs."""
     service = EvaluationService(session)
     runs = await service.list_runs(agent_id=agent_id, skip=skip, limit=limit)
-    return [
-        EvaluationRunListItem(
+    # model_construct skips validation; the rows come straight from the DB
+    items = [
+        EvaluationRunListItem.model_construct(
             id=run.id,
             agent_id=run.agent_id,
             status=run.status,
@@ -67,6 +79,7 @@ async def list_evaluations(
         )
         for run in runs
     ]
+    return Response(content=_RUN_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
 
 @router.get("/{run_id}", response_model=EvaluationRunRead)
@@ -104,6 +117,24 @@ async def get_evaluation(
     )
 
 
+@router.get("/{run_id}/results.ndjson")
+async def stream_evaluation_results(
+    run_id: UUID,
+    session: AsyncSession = Depends(get_session),
+):
+    """Stream a run's results as NDJSON, one result per line.
+
+    Avoids buffering the full payload in memory for large runs.
+    """
+    service = EvaluationService(session)
+
+    async def generate():
+        async for result in service.stream_results(run_id):
+            yield orjson.dumps(result.model_dump()) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.websocket("/ws/{run_id}")
 async def evaluation_progress_websocket(
     websocket: WebSocket,
@@ -113,13 +144,45 @@ async def evaluation_progress_websocket(
 
     Connect to ws://host/api/v1/evaluations/ws/{run_id}
 
-    Receive updates as JSON:
+    Receive updates as JSON, either a single object or a list of objects
+    when several updates were ready at once:
     - {"run_id": "...", "status": "running", "progress_percent": 50, ...}
     """
-    await manager.connect_progress(websocket, run_id)
+    queue = await manager.connect_progress(websocket, run_id)
+    # Wait on the socket alongside the queue: a run that never produces
+    # another frame would otherwise leave a disconnected client's handler
+    # and queue registered forever
+    queue_task = asyncio.create_task(queue.get())
+    receive_task = asyncio.create_task(websocket.receive())
     try:
         while True:
-            # Keep connection alive, wait for disconnect
-            await websocket.receive_text()
+            done, _ = await asyncio.wait(
+                (queue_task, receive_task), return_when=asyncio.FIRST_COMPLETED
+            )
+            if receive_task in done:
+                # Clients only send to hang up; ignore anything else
+                if receive_task.result()["type"] == "websocket.disconnect":
+                    break
+                receive_task = asyncio.create_task(websocket.receive())
+            if queue_task in done:
+                # Drain whatever else is ready so bursts go out as one
+                # frame instead of one send() per update
+                message = queue_task.result()
+                batch = [message]
+                while len(batch) < PROGRESS_BATCH_MAX:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                # Frames arrive pre-serialized; join a burst into a JSON array
+                if len(batch) > 1:
+                    await websocket.send_bytes(b"[" + b",".join(batch) + b"]")
+                else:
+                    await websocket.send_bytes(message)
+                queue_task = asyncio.create_task(queue.get())
     except Exception:
+        pass
+    finally:
+        queue_task.cancel()
+        receive_task.cancel()
         manager.disconnect_progress(websocket, run_id)
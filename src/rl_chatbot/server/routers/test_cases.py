@@ -1,10 +1,12 @@
 """Test case CRUD endpoints."""
 
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import insert, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -13,6 +15,10 @@ from ..models import TestCase, TestCaseCreate, TestCaseRead
 
 router = APIRouter()
 
+# Built once: reusing the compiled serializer and returning its bytes
+# directly skips FastAPI's per-response validation and encoding pass
+_TEST_CASE_LIST_ADAPTER = TypeAdapter(List[TestCase])
+
 
 class TestCaseUpdate(BaseModel):
     """Schema for updating a test case."""
@@ -50,28 +56,52 @@ async def bulk_create_test_cases(
     session: AsyncSession = Depends(get_session),
 ):
     """Bulk create test cases from a list."""
-    test_cases = [TestCase(**tc.model_dump()) for tc in bulk_data.test_cases]
-    session.add_all(test_cases)
+    # An empty parameter list would degrade into a defaults-only INSERT
+    if not bulk_data.test_cases:
+        return []
+    # Single INSERT ... RETURNING instead of add_all + a refresh round-trip
+    # per row; the model constructor fills ids and timestamps client-side
+    values = [TestCase(**tc.model_dump()).model_dump() for tc in bulk_data.test_cases]
+    result = await session.execute(insert(TestCase).returning(TestCase), values)
+    test_cases = list(result.scalars().all())
     await session.commit()
-    for tc in test_cases:
-        await session.refresh(tc)
     return test_cases
 
 
-@router.get("", response_model=List[TestCaseRead])
+@router.get("", response_model=None)
 async def list_test_cases(
     skip: int = 0,
     limit: int = 100,
     active_only: bool = True,
+    cursor_created_at: Optional[datetime] = Query(
+        None, description="Keyset cursor: created_at of the last item of the previous page"
+    ),
+    cursor_id: Optional[UUID] = Query(
+        None, description="Keyset cursor: id of the last item of the previous page"
+    ),
     session: AsyncSession = Depends(get_session),
 ):
-    """List all test cases."""
+    """List all test cases.
+
+    Pass the last item's created_at and id as the cursor for the next
+    page; keyset pagination stays O(limit) at any depth, where OFFSET
+    scans and discards every skipped row.
+    """
     query = select(TestCase)
     if active_only:
         query = query.where(TestCase.is_active == True)
-    query = query.offset(skip).limit(limit).order_by(TestCase.created_at.desc())
+    if cursor_created_at is not None and cursor_id is not None:
+        query = query.where(
+            tuple_(TestCase.created_at, TestCase.id) < (cursor_created_at, cursor_id)
+        )
+    else:
+        query = query.offset(skip)
+    query = query.order_by(TestCase.created_at.desc(), TestCase.id.desc()).limit(limit)
     result = await session.execute(query)
-    return list(result.scalars().all())
+    return Response(
+        content=_TEST_CASE_LIST_ADAPTER.dump_json(list(result.scalars().all())),
+        media_type="application/json",
+    )
 
 
 @router.get("/{test_case_id}", response_model=TestCaseRead)
@@ -94,18 +124,23 @@ async def update_test_case(
     session: AsyncSession = Depends(get_session),
 ):
     """Update a test case."""
-    result = await session.execute(select(TestCase).where(TestCase.id == test_case_id))
+    # model_fields_set walks only the fields the client actually sent, and
+    # a single UPDATE ... RETURNING replaces SELECT + UPDATE + refresh
+    fields = {name: getattr(test_case_data, name) for name in test_case_data.model_fields_set}
+    if not fields:
+        return await get_test_case(test_case_id, session)
+
+    result = await session.execute(
+        update(TestCase)
+        .where(TestCase.id == test_case_id)
+        .values(**fields)
+        .returning(TestCase)
+    )
     test_case = result.scalar_one_or_none()
     if not test_case:
         raise HTTPException(status_code=404, detail="Test case not found")
 
-    update_data = test_case_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(test_case, key, value)
-
-    session.add(test_case)
     await session.commit()
-    await session.refresh(test_case)
     return test_case
 
 
@@ -115,12 +150,15 @@ async def delete_test_case(
     session: AsyncSession = Depends(get_session),
 ):
     """Delete a test case (soft delete)."""
-    result = await session.execute(select(TestCase).where(TestCase.id == test_case_id))
-    test_case = result.scalar_one_or_none()
-    if not test_case:
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+    result = await session.execute(
+        update(TestCase)
+        .where(TestCase.id == test_case_id)
+        .values(is_active=False)
+        .returning(TestCase.id)
+    )
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Test case not found")
 
-    test_case.is_active = False
-    session.add(test_case)
     await session.commit()
     return None
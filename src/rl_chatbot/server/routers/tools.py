@@ -18,16 +18,20 @@ class ToolSchema(BaseModel):
     parameters: dict[str, Any]
 
 
+# The tool set is fixed for the process lifetime, so build the registry and
+# the response payload once at import instead of per request
+_REGISTRY = create_default_tool_registry()
+_CACHED_TOOLS = [
+    ToolSchema(
+        name=tool.name,
+        description=tool.description,
+        parameters=tool.parameters,
+    )
+    for tool in _REGISTRY.list_tools()
+]
+
+
 @router.get("", response_model=List[ToolSchema])
 async def list_tools():
     """List all available tools."""
-    registry = create_default_tool_registry()
-    tools = registry.list_tools()
-    return [
-        ToolSchema(
-            name=tool.name,
-            description=tool.description,
-            parameters=tool.parameters,
-        )
-        for tool in tools
-    ]
+    return _CACHED_TOOLS
@@ -1,9 +1,13 @@
 """Training endpoints."""
 
+import asyncio
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, WebSocket, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_session, async_session
@@ -18,6 +22,13 @@ from ..websocket.manager import manager
 
 router = APIRouter()
 
+# Max progress updates coalesced into one WebSocket frame
+PROGRESS_BATCH_MAX = 64
+
+# Built once: reusing the compiled serializer and returning its bytes
+# directly skips FastAPI's per-response validation and encoding pass
+_RUN_LIST_ADAPTER = TypeAdapter(List[TrainingRunListItem])
+
 
 @router.post("", response_model=TrainingRunListItem)
 async def start_training(
@@ -46,7 +57,7 @@ async def start_training(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("", response_model=List[TrainingRunListItem])
+@router.get("", response_model=None)
 async def list_training_runs(
     agent_id: Optional[UUID] = Query(None, description="Filter by agent ID"),
     skip: int = 0,
@@ -56,8 +67,9 @@ async def list_training_runs(
     """List training runs."""
     service = TrainingService(session)
     runs = await service.list_runs(agent_id=agent_id, skip=skip, limit=limit)
-    return [
-        TrainingRunListItem(
+    # model_construct skips validation; the rows come straight from the DB
+    items = [
+        TrainingRunListItem.model_construct(
             id=run.id,
             agent_id=run.agent_id,
             status=run.status,
@@ -69,6 +81,7 @@ async def list_training_runs(
         )
         for run in runs
     ]
+    return Response(content=_RUN_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
 
 @router.get("/{run_id}", response_model=TrainingRunRead)
@@ -101,11 +114,30 @@ async def get_training_run(
                 num_test_cases=e.num_test_cases,
                 created_at=e.created_at,
             )
-            for e in sorted(run.episodes, key=lambda x: x.episode_num)
+            # episodes relationship is ordered by episode_num in SQL
+            for e in run.episodes
         ],
     )
 
 
+@router.get("/{run_id}/episodes.ndjson")
+async def stream_training_episodes(
+    run_id: UUID,
+    session: AsyncSession = Depends(get_session),
+):
+    """Stream a run's episodes as NDJSON, one episode per line.
+
+    Avoids buffering the full payload in memory for large runs.
+    """
+    service = TrainingService(session)
+
+    async def generate():
+        async for episode in service.stream_episodes(run_id):
+            yield orjson.dumps(episode.model_dump()) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.post("/{run_id}/stop")
 async def stop_training(
     run_id: UUID,
@@ -115,7 +147,8 @@ async def stop_training(
     service = TrainingService(session)
     success = await service.stop_training(run_id)
     if success:
-        return {"status": "stopping", "run_id": str(run_id)}
+        # orjson renders UUIDs natively; no str() pass needed
+        return {"status": "stopping", "run_id": run_id}
     raise HTTPException(status_code=404, detail="Training run not found or not running")
 
 
@@ -128,13 +161,45 @@ async def training_progress_websocket(
 
     Connect to ws://host/api/v1/training/ws/{run_id}
 
-    Receive updates as JSON:
+    Receive updates as JSON, either a single object or a list of objects
+    when several updates were ready at once:
     - {"run_id": "...", "status": "running", "progress_percent": 50, ...}
     """
-    await manager.connect_progress(websocket, run_id)
+    queue = await manager.connect_progress(websocket, run_id)
+    # Wait on the socket alongside the queue: a run that never produces
+    # another frame would otherwise leave a disconnected client's handler
+    # and queue registered forever
+    queue_task = asyncio.create_task(queue.get())
+    receive_task = asyncio.create_task(websocket.receive())
     try:
         while True:
-            # Keep connection alive, wait for disconnect
-            await websocket.receive_text()
+            done, _ = await asyncio.wait(
+                (queue_task, receive_task), return_when=asyncio.FIRST_COMPLETED
+            )
+            if receive_task in done:
+                # Clients only send to hang up; ignore anything else
+                if receive_task.result()["type"] == "websocket.disconnect":
+                    break
+                receive_task = asyncio.create_task(websocket.receive())
+            if queue_task in done:
+                # Drain whatever else is ready so bursts go out as one
+                # frame instead of one send() per update
+                message = queue_task.result()
+                batch = [message]
+                while len(batch) < PROGRESS_BATCH_MAX:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                # Frames arrive pre-serialized; join a burst into a JSON array
+                if len(batch) > 1:
+                    await websocket.send_bytes(b"[" + b",".join(batch) + b"]")
+                else:
+                    await websocket.send_bytes(message)
+                queue_task = asyncio.create_task(queue.get())
     except Exception:
+        pass
+    finally:
+        queue_task.cancel()
+        receive_task.cancel()
         manager.disconnect_progress(websocket, run_id)
@@ -1,5 +1,6 @@
 """Chat API schemas."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Any
 from uuid import UUID
@@ -28,6 +29,21 @@ class ChatRequest(BaseModel):
     conversation_id: Optional[UUID] = None  # If None, creates new conversation
 
 
+@dataclass(slots=True)
+class InternalChatRequest:
+    """ChatRequest without Pydantic validation, for trusted callers.
+
+    The WebSocket handler builds one per inbound message from fields that
+    are already validated (path UUID, prior response UUID), so the
+    per-turn validator dispatch of ChatRequest buys nothing there. HTTP
+    ingress keeps the Pydantic model.
+    """
+
+    agent_id: UUID
+    message: str
+    conversation_id: Optional[UUID] = None
+
+
 class ChatResponse(BaseModel):
     """Schema for a chat response."""
 
@@ -14,6 +14,7 @@ class TrainingRequest(BaseModel):
     num_episodes: int = 10
     test_case_ids: Optional[List[UUID]] = None  # If None, use all active test cases
     reward_weights: Optional[dict[str, float]] = None  # Custom reward weights
+    concurrency: int = 8  # Max concurrent test-case rollouts per episode
 
 
 class TrainingProgress(BaseModel):
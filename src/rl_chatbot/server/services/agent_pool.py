@@ -0,0 +1,51 @@
+"""Shared checkout pool of in-memory agents for background runs.
+
+Evaluation and training spin up many short-lived agents (one per
+concurrent rollout). Construction pays for client and tool setup, so
+finished agents are parked here and handed back out instead of being
+rebuilt. Acquire/release never await between touching the idle list, so
+on a single event loop no locking is needed.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from rl_chatbot.agents.base import BaseAgent
+from rl_chatbot.factory import AgentFactory
+
+# (agent_type, model, temperature) identifies interchangeable agents
+PoolKey = Tuple[str, str, float]
+
+# Idle agents kept per configuration; extras beyond this are dropped
+_POOL_MAX_PER_KEY = 16
+
+
+class AgentCheckoutPool:
+    """Checkout pool of reusable agents keyed by configuration."""
+
+    def __init__(self):
+        self._factory = AgentFactory()
+        self._idle: Dict[PoolKey, List[BaseAgent]] = defaultdict(list)
+
+    def acquire(self, agent_type: str, model: str, temperature: float) -> BaseAgent:
+        """Take an idle agent for this configuration, creating one if none."""
+        idle = self._idle[(agent_type, model, temperature)]
+        if idle:
+            agent = idle.pop()
+            agent.reset(clear_conversation_id=True)
+            return agent
+        return self._factory.create_agent(
+            agent_type=agent_type,
+            model=model,
+            temperature=temperature,
+        )
+
+    def release(self, agent_type: str, model: str, temperature: float, agent: BaseAgent):
+        """Return an agent to the pool for reuse."""
+        idle = self._idle[(agent_type, model, temperature)]
+        if len(idle) < _POOL_MAX_PER_KEY:
+            idle.append(agent)
+
+
+# Process-wide pool shared by the evaluation and training services
+agent_pool = AgentCheckoutPool()
@@ -4,8 +4,9 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
+from sqlalchemy import tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlmodel import select, func
 
 from ..models import Agent, AgentCreate, AgentUpdate
 
@@ -34,40 +35,56 @@ class AgentService:
         skip: int = 0,
         limit: int = 100,
         active_only: bool = True,
+        cursor_created_at: Optional[datetime] = None,
+        cursor_id: Optional[UUID] = None,
     ) -> List[Agent]:
-        """List all agents with pagination."""
+        """List all agents with pagination.
+
+        When a (created_at, id) cursor is given, keyset pagination is used
+        instead of OFFSET, so deep pages stay O(limit).
+        """
         query = select(Agent)
         if active_only:
             query = query.where(Agent.is_active == True)
-        query = query.offset(skip).limit(limit).order_by(Agent.created_at.desc())
+        if cursor_created_at is not None and cursor_id is not None:
+            query = query.where(
+                tuple_(Agent.created_at, Agent.id) < (cursor_created_at, cursor_id)
+            )
+        else:
+            query = query.offset(skip)
+        query = query.order_by(Agent.created_at.desc(), Agent.id.desc()).limit(limit)
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
     async def update(self, agent_id: UUID, agent_data: AgentUpdate) -> Optional[Agent]:
         """Update an agent."""
-        agent = await self.get(agent_id)
+        # Single UPDATE ... RETURNING; updated_at is set server-side,
+        # atomically with the write
+        update_data = agent_data.model_dump(exclude_unset=True)
+        result = await self.session.execute(
+            update(Agent)
+            .where(Agent.id == agent_id)
+            .values(updated_at=func.now(), **update_data)
+            .returning(Agent)
+        )
+        agent = result.scalar_one_or_none()
         if not agent:
             return None
 
-        update_data = agent_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(agent, key, value)
-
-        agent.updated_at = datetime.utcnow()
-        self.session.add(agent)
         await self.session.commit()
-        await self.session.refresh(agent)
         return agent
 
     async def delete(self, agent_id: UUID) -> bool:
         """Soft delete an agent."""
-        agent = await self.get(agent_id)
-        if not agent:
+        result = await self.session.execute(
+            update(Agent)
+            .where(Agent.id == agent_id)
+            .values(is_active=False, updated_at=func.now())
+            .returning(Agent.id)
+        )
+        if result.scalar_one_or_none() is None:
             return False
 
-        agent.is_active = False
-        agent.updated_at = datetime.utcnow()
-        self.session.add(agent)
         await self.session.commit()
         return True
 
@@ -1,73 +1,128 @@
 """Chat service for handling conversations with agents."""
 
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Union
 from uuid import UUID
 
+import orjson
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlalchemy.orm import selectinload
+from sqlmodel import select, func
 
 from ..models import Agent, Conversation, Message, ToolCall
-from ..schemas.chat import ChatRequest, ChatResponse, ToolCallRead
+from ..schemas.chat import ChatRequest, ChatResponse, InternalChatRequest, ToolCallRead
 
 from rl_chatbot.factory import AgentFactory
 from rl_chatbot.agents.base import BaseAgent
 
 
+# Module-level LRU of in-memory agents, shared across requests. Agent
+# construction (client/tool setup) is expensive, and a per-request dict
+# never gets a hit; the bound keeps a burst of distinct agents from
+# growing memory without limit. Each entry pairs the agent with the
+# conversation its in-memory context belongs to, so the agent can be
+# reset whenever it is reused for a different conversation.
+_AGENT_CACHE_MAX = 128
+_agent_cache: "OrderedDict[Tuple[UUID, str, str, float], Tuple[BaseAgent, UUID]]" = (
+    OrderedDict()
+)
+
+
+def clear_agent_cache() -> None:
+    """Drop all cached in-memory agents."""
+    _agent_cache.clear()
+
+
 class ChatService:
-    """Service for handling chat interactions."""
+    """Service for handling chat interactions.
+
+    The service is a long-lived singleton; sessions are passed per call so
+    the factory and sequence-number cache survive across requests.
+    """
 
-    def __init__(self, session: AsyncSession):
-        self.session = session
+    def __init__(self):
         self._factory = AgentFactory()
-        self._active_agents: Dict[UUID, BaseAgent] = {}
+        # conversation_id -> last assigned sequence_num; populated lazily
+        # with one query, then advanced in-process per message
+        self._last_sequence_nums: Dict[UUID, int] = {}
 
-    async def _get_or_create_agent(self, agent_db: Agent) -> BaseAgent:
-        """Get or create an in-memory agent instance."""
-        if agent_db.id not in self._active_agents:
+    async def _get_or_create_agent(
+        self, agent_db: Agent, conversation_id: UUID
+    ) -> BaseAgent:
+        """Get or create an in-memory agent instance for a conversation."""
+        key = (agent_db.id, agent_db.agent_type, agent_db.model, agent_db.temperature)
+        entry = _agent_cache.get(key)
+        if entry is None:
             agent = self._factory.create_agent(
                 agent_type=agent_db.agent_type,
                 model=agent_db.model,
                 temperature=agent_db.temperature,
                 conversation_id=str(agent_db.id),
             )
-            self._active_agents[agent_db.id] = agent
-        return self._active_agents[agent_db.id]
+            _agent_cache[key] = (agent, conversation_id)
+            if len(_agent_cache) > _AGENT_CACHE_MAX:
+                _agent_cache.popitem(last=False)
+        else:
+            agent, last_conversation_id = entry
+            _agent_cache.move_to_end(key)
+            # The cached agent keeps its conversation context in memory;
+            # reset on a conversation switch so one conversation's turns
+            # never ride along in another's model calls
+            if last_conversation_id != conversation_id:
+                agent.reset()
+                _agent_cache[key] = (agent, conversation_id)
+        return agent
 
     async def _get_or_create_conversation(
         self,
+        session: AsyncSession,
         agent_id: UUID,
         conversation_id: Optional[UUID] = None,
+        load_messages: bool = False,
     ) -> Conversation:
-        """Get existing conversation or create a new one."""
+        """Get existing conversation or create a new one.
+
+        With ``load_messages`` the history and its tool calls are fetched
+        eagerly in one pass instead of O(messages) lazy loads. The chat
+        turn itself only needs the row, so it keeps the default.
+        """
         if conversation_id:
-            result = await self.session.execute(
-                select(Conversation).where(Conversation.id == conversation_id)
-            )
+            query = select(Conversation).where(Conversation.id == conversation_id)
+            if load_messages:
+                query = query.options(
+                    selectinload(Conversation.messages).selectinload(Message.tool_calls)
+                )
+            result = await session.execute(query)
             conversation = result.scalar_one_or_none()
             if conversation:
                 return conversation
 
-        # Create new conversation
+        # Create new conversation; flushed (not committed) so the chat turn
+        # stays one transaction with a single commit at the end
         conversation = Conversation(agent_id=agent_id)
-        self.session.add(conversation)
-        await self.session.commit()
-        await self.session.refresh(conversation)
+        session.add(conversation)
+        await session.flush()
         return conversation
 
-    async def _get_next_sequence_num(self, conversation_id: UUID) -> int:
+    async def _get_next_sequence_num(
+        self, session: AsyncSession, conversation_id: UUID
+    ) -> int:
         """Get the next sequence number for a conversation."""
-        result = await self.session.execute(
-            select(Message)
-            .where(Message.conversation_id == conversation_id)
-            .order_by(Message.sequence_num.desc())
-            .limit(1)
-        )
-        last_message = result.scalar_one_or_none()
-        return (last_message.sequence_num + 1) if last_message else 1
+        last = self._last_sequence_nums.get(conversation_id)
+        if last is None:
+            result = await session.execute(
+                select(func.max(Message.sequence_num)).where(
+                    Message.conversation_id == conversation_id
+                )
+            )
+            last = result.scalar_one_or_none() or 0
+        return last + 1
 
     async def _save_message(
         self,
+        session: AsyncSession,
         conversation_id: UUID,
         role: str,
         content: str,
@@ -80,65 +135,68 @@ class ChatService:
             content=content,
             sequence_num=sequence_num,
         )
-        self.session.add(message)
-        await self.session.commit()
-        await self.session.refresh(message)
+        session.add(message)
+        await session.flush()
         return message
 
     async def _save_tool_calls(
         self,
+        session: AsyncSession,
         message_id: UUID,
         tool_calls: list[dict[str, Any]],
     ) -> list[ToolCall]:
         """Save tool calls to the database."""
-        import json
-
         saved_tool_calls = []
         for tc in tool_calls:
-            # Parse arguments if they're a string
+            # Parse arguments if they're a string; orjson parses in C
             arguments = tc.get("arguments")
             if isinstance(arguments, str):
                 try:
-                    arguments = json.loads(arguments)
-                except json.JSONDecodeError:
+                    arguments = orjson.loads(arguments)
+                except orjson.JSONDecodeError:
                     arguments = {"raw": arguments}
 
-            tool_call = ToolCall(
-                message_id=message_id,
-                tool_name=tc.get("name", "unknown"),
-                arguments_json=arguments,
-                result=tc.get("result"),
+            saved_tool_calls.append(
+                ToolCall(
+                    message_id=message_id,
+                    tool_name=tc.get("name", "unknown"),
+                    arguments_json=arguments,
+                    result=tc.get("result"),
+                )
             )
-            self.session.add(tool_call)
-            saved_tool_calls.append(tool_call)
 
-        await self.session.commit()
-        for tc in saved_tool_calls:
-            await self.session.refresh(tc)
+        # ids and timestamps are assigned client-side and the session keeps
+        # attributes live, so no per-row refresh is needed
+        session.add_all(saved_tool_calls)
+        await session.flush()
         return saved_tool_calls
 
-    async def chat(self, request: ChatRequest) -> ChatResponse:
+    async def chat(
+        self, session: AsyncSession, request: Union[ChatRequest, InternalChatRequest]
+    ) -> ChatResponse:
         """Process a chat message and return response."""
         # Get agent from database
-        result = await self.session.execute(select(Agent).where(Agent.id == request.agent_id))
+        result = await session.execute(select(Agent).where(Agent.id == request.agent_id))
         agent_db = result.scalar_one_or_none()
         if not agent_db:
             raise ValueError(f"Agent {request.agent_id} not found")
 
         # Get or create conversation
         conversation = await self._get_or_create_conversation(
+            session,
             agent_id=request.agent_id,
             conversation_id=request.conversation_id,
         )
 
-        # Get in-memory agent
-        agent = await self._get_or_create_agent(agent_db)
+        # Get in-memory agent bound to this conversation
+        agent = await self._get_or_create_agent(agent_db, conversation.id)
 
         # Get sequence numbers
-        user_seq = await self._get_next_sequence_num(conversation.id)
+        user_seq = await self._get_next_sequence_num(session, conversation.id)
 
         # Save user message
         await self._save_message(
+            session,
             conversation_id=conversation.id,
             role="user",
             content=request.message,
@@ -154,6 +212,7 @@ class ChatService:
         # Save assistant message
         assistant_seq = user_seq + 1
         assistant_message = await self._save_message(
+            session,
             conversation_id=conversation.id,
             role="assistant",
             content=response_text,
@@ -164,6 +223,7 @@ class ChatService:
         tool_calls_read = []
         if agent_tool_calls:
             saved_tool_calls = await self._save_tool_calls(
+                session,
                 message_id=assistant_message.id,
                 tool_calls=agent_tool_calls,
             )
@@ -179,6 +239,13 @@ class ChatService:
                 for tc in saved_tool_calls
             ]
 
+        # Single commit for the whole turn: conversation, both messages, and
+        # tool calls land in one transaction and one fsync
+        await session.commit()
+
+        # Advance the cached cursor only after the commit succeeds
+        self._last_sequence_nums[conversation.id] = assistant_seq
+
         return ChatResponse(
             conversation_id=conversation.id,
             agent_id=request.agent_id,
@@ -190,18 +257,19 @@ class ChatService:
 
     async def reset_agent(self, agent_id: UUID) -> bool:
         """Reset an agent's in-memory state."""
-        if agent_id in self._active_agents:
-            self._active_agents[agent_id].reset(clear_conversation_id=False)
-            return True
-        return False
+        reset_any = False
+        for key, (agent, _) in _agent_cache.items():
+            if key[0] == agent_id:
+                agent.reset(clear_conversation_id=False)
+                reset_any = True
+        return reset_any
 
 
-# Global chat service singleton for agent state management
-_chat_services: Dict[str, ChatService] = {}
+# One service for the process: its factory and sequence-number cache are
+# shared across requests, while each call brings its own session
+_chat_service = ChatService()
 
 
-def get_chat_service(session: AsyncSession) -> ChatService:
-    """Get or create a chat service for the session."""
-    # For simplicity, create a new service per request
-    # In production, you'd want to manage agent instances more carefully
-    return ChatService(session)
+def get_chat_service() -> ChatService:
+    """Get the shared chat service; pass a session into each call."""
+    return _chat_service
@@ -1,22 +1,41 @@
 """Evaluation service for running agent evaluations."""
 
 import asyncio
-from datetime import datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import select, func
 
+from ..config import get_settings
+from ..models._common import utcnow
 from ..models import Agent, TestCase, EvaluationRun, EvaluationResult
 from ..schemas.evaluation import EvaluationRequest, EvaluationProgress
 from ..websocket.manager import manager
+from .agent_pool import agent_pool
 
 from rl_chatbot.factory import AgentFactory
 from rl_chatbot.evaluation.evaluator import Evaluator
 
 
+# Cap on concurrent test-case evaluations (each one is an outbound LLM call)
+EVAL_CONCURRENCY = 8
+
+# Runs beyond max_concurrent_runs queue here instead of all executing at once
+_run_slots = asyncio.Semaphore(get_settings().max_concurrent_runs)
+
+
+def _test_case_query(test_case_ids: Optional[List[UUID]], count: bool = False):
+    """Build the active-test-case query, optionally as a COUNT."""
+    query = select(func.count()).select_from(TestCase) if count else select(TestCase)
+    query = query.where(TestCase.is_active == True)
+    if test_case_ids:
+        query = query.where(TestCase.id.in_(test_case_ids))
+    return query
+
+
 class EvaluationService:
     """Service for running evaluations."""
 
@@ -33,28 +52,22 @@ class EvaluationService:
         if not agent_db:
             raise ValueError(f"Agent {request.agent_id} not found")
 
-        # Get test cases
-        if request.test_case_ids:
-            result = await self.session.execute(
-                select(TestCase).where(
-                    TestCase.id.in_(request.test_case_ids),
-                    TestCase.is_active == True,
-                )
+        # Count matching test cases; the background runner streams the rows
+        # from its own session instead of materializing them twice
+        num_test_cases = (
+            await self.session.execute(
+                _test_case_query(request.test_case_ids, count=True)
             )
-        else:
-            result = await self.session.execute(
-                select(TestCase).where(TestCase.is_active == True)
-            )
-        test_cases = list(result.scalars().all())
+        ).scalar_one()
 
-        if not test_cases:
+        if not num_test_cases:
             raise ValueError("No test cases found")
 
         # Create evaluation run
         run = EvaluationRun(
             agent_id=request.agent_id,
             status="pending",
-            num_test_cases=len(test_cases),
+            num_test_cases=num_test_cases,
         )
         self.session.add(run)
         await self.session.commit()
@@ -62,7 +75,7 @@ class EvaluationService:
 
         # Start background task
         task = asyncio.create_task(
-            self._run_evaluation(run.id, agent_db, test_cases)
+            self._run_evaluation(run.id, agent_db, request, num_test_cases)
         )
         self._running_tasks[run.id] = task
 
@@ -72,125 +85,154 @@ class EvaluationService:
         self,
         run_id: UUID,
         agent_db: Agent,
-        test_cases: List[TestCase],
+        request: EvaluationRequest,
+        num_test_cases: int,
     ):
         """Run evaluation in background."""
         # Need a new session for background task
         from ..database import async_session
 
-        async with async_session() as session:
+        async with _run_slots, async_session() as session:
             try:
-                # Update status to running
+                # Fetch the run once; it stays attached in the identity map,
+                # so later status updates mutate it without re-SELECTing
                 result = await session.execute(
                     select(EvaluationRun).where(EvaluationRun.id == run_id)
                 )
                 run = result.scalar_one()
                 run.status = "running"
-                session.add(run)
                 await session.commit()
 
-                # Create in-memory agent
-                agent = self._factory.create_agent(
-                    agent_type=agent_db.agent_type,
-                    model=agent_db.model,
-                    temperature=agent_db.temperature,
-                )
-
-                # Create evaluator
-                evaluator = Evaluator(agent)
-
-                # Run evaluation for each test case
-                total_metrics = {
-                    "task_success": 0.0,
-                    "tool_usage_efficiency": 0.0,
-                    "response_quality": 0.0,
-                    "reward": 0.0,
-                }
-
-                for i, test_case in enumerate(test_cases):
-                    # Send progress update
+                # Evaluate test cases concurrently: each one is an I/O-bound
+                # LLM round-trip, so bounded gather cuts wall time from the
+                # sum of latencies to roughly the slowest batch
+                semaphore = asyncio.Semaphore(EVAL_CONCURRENCY)
+                completed = 0
+
+                async def _eval_one(
+                    test_case_id: UUID,
+                    user_input: str,
+                    expected_output: Optional[str],
+                    expected_tools: List[str],
+                    task_type: str,
+                ):
+                    nonlocal completed
+                    async with semaphore:
+                        # Pooled agent per task: each concurrent task holds
+                        # its own, so no shared reset() races
+                        agent = agent_pool.acquire(
+                            agent_db.agent_type, agent_db.model, agent_db.temperature
+                        )
+                        try:
+                            evaluator = Evaluator(agent)
+                            metrics = await asyncio.to_thread(
+                                evaluator.evaluate_single,
+                                user_input=user_input,
+                                expected_output=expected_output,
+                                expected_tools=expected_tools,
+                                task_type=task_type,
+                            )
+                            tool_calls = agent.get_last_tool_calls()
+                        finally:
+                            agent_pool.release(
+                                agent_db.agent_type, agent_db.model, agent_db.temperature, agent
+                            )
+
+                    completed += 1
                     progress = EvaluationProgress(
                         run_id=run_id,
                         status="running",
-                        current_test_case=i + 1,
-                        total_test_cases=len(test_cases),
-                        progress_percent=int((i / len(test_cases)) * 100),
-                        message=f"Evaluating test case {i + 1}/{len(test_cases)}",
+                        current_test_case=completed,
+                        total_test_cases=num_test_cases,
+                        progress_percent=int((completed / num_test_cases) * 100),
+                        message=f"Evaluated test case {completed}/{num_test_cases}",
                     )
-                    await manager.send_progress(run_id, progress.model_dump())
-
-                    # Reset agent for each test case
-                    agent.reset()
-
-                    # Run evaluation
-                    metrics = evaluator.evaluate_single(
-                        user_input=test_case.user_input,
-                        expected_output=test_case.expected_output,
-                        expected_tools=test_case.expected_tools_json or [],
-                        task_type=test_case.task_type,
+                    await manager.send_progress(run_id, progress.model_dump_json().encode())
+                    return test_case_id, metrics, tool_calls
+
+                # Stream test cases instead of materializing the full set;
+                # each task captures only the plain fields it needs, so ORM
+                # rows are released as the cursor advances
+                rows = await session.stream_scalars(
+                    _test_case_query(request.test_case_ids).execution_options(yield_per=100)
+                )
+                tasks = []
+                async for tc in rows:
+                    tasks.append(
+                        asyncio.create_task(
+                            _eval_one(
+                                tc.id,
+                                tc.user_input,
+                                tc.expected_output,
+                                tc.expected_tools_json or [],
+                                tc.task_type,
+                            )
+                        )
                     )
-
-                    # Get tool calls
-                    tool_calls = agent.get_last_tool_calls()
-
-                    # Save result
-                    eval_result = EvaluationResult(
-                        evaluation_run_id=run_id,
-                        test_case_id=test_case.id,
-                        task_success=metrics.task_success,
-                        tool_usage_efficiency=metrics.tool_usage_efficiency,
-                        response_quality=metrics.response_quality,
-                        reward=metrics.reward,
-                        response_text=agent.chat(""),  # Get last response
-                        tool_calls_json=tool_calls,
+                outcomes = await asyncio.gather(*tasks)
+
+                for test_case_id, metrics, tool_calls in outcomes:
+                    session.add(
+                        EvaluationResult(
+                            evaluation_run_id=run_id,
+                            test_case_id=test_case_id,
+                            task_success=metrics.task_success,
+                            tool_usage_efficiency=metrics.tool_usage_efficiency,
+                            response_quality=metrics.response_quality,
+                            reward=metrics.reward,
+                            # Rides along on the metrics; no second LLM call
+                            response_text=metrics.response_text,
+                            tool_calls_json=tool_calls,
+                        )
                     )
-                    session.add(eval_result)
-
-                    # Accumulate metrics
-                    total_metrics["task_success"] += metrics.task_success
-                    total_metrics["tool_usage_efficiency"] += metrics.tool_usage_efficiency
-                    total_metrics["response_quality"] += metrics.response_quality
-                    total_metrics["reward"] += metrics.reward
-
                 await session.commit()
 
-                # Calculate aggregate metrics
-                n = len(test_cases)
+                # Aggregate in the database: one AVG query over the rows
+                # just persisted replaces hand-rolled Python summation
+                result = await session.execute(
+                    select(
+                        func.avg(EvaluationResult.task_success),
+                        func.avg(EvaluationResult.tool_usage_efficiency),
+                        func.avg(EvaluationResult.response_quality),
+                        func.avg(EvaluationResult.reward),
+                    ).where(EvaluationResult.evaluation_run_id == run_id)
+                )
+                avg_row = result.one()
                 aggregate_metrics = {
-                    k: v / n for k, v in total_metrics.items()
+                    "task_success": avg_row[0] or 0.0,
+                    "tool_usage_efficiency": avg_row[1] or 0.0,
+                    "response_quality": avg_row[2] or 0.0,
+                    "reward": avg_row[3] or 0.0,
                 }
 
-                # Update run as completed
-                result = await session.execute(
-                    select(EvaluationRun).where(EvaluationRun.id == run_id)
-                )
-                run = result.scalar_one()
+                # Update run as completed on the already-attached instance
                 run.status = "completed"
-                run.completed_at = datetime.utcnow()
+                run.completed_at = utcnow()
                 run.aggregate_metrics_json = aggregate_metrics
-                session.add(run)
                 await session.commit()
 
                 # Send completion update
                 progress = EvaluationProgress(
                     run_id=run_id,
                     status="completed",
-                    current_test_case=len(test_cases),
-                    total_test_cases=len(test_cases),
+                    current_test_case=num_test_cases,
+                    total_test_cases=num_test_cases,
                     progress_percent=100,
                     message="Evaluation completed",
                 )
-                await manager.send_progress(run_id, progress.model_dump())
+                await manager.send_progress(
+                    run_id, progress.model_dump_json().encode(), flush=True
+                )
 
             except Exception as e:
-                # Update run as failed
-                result = await session.execute(
-                    select(EvaluationRun).where(EvaluationRun.id == run_id)
+                # The session may hold a half-done transaction; roll it back
+                # and mark the run failed with one direct UPDATE, no SELECT
+                await session.rollback()
+                await session.execute(
+                    update(EvaluationRun)
+                    .where(EvaluationRun.id == run_id)
+                    .values(status="failed", completed_at=utcnow())
                 )
-                run = result.scalar_one()
-                run.status = "failed"
-                run.completed_at = datetime.utcnow()
-                session.add(run)
                 await session.commit()
 
                 # Send failure update
@@ -198,11 +240,13 @@ class EvaluationService:
                     run_id=run_id,
                     status="failed",
                     current_test_case=0,
-                    total_test_cases=len(test_cases),
+                    total_test_cases=num_test_cases,
                     progress_percent=0,
                     message=f"Evaluation failed: {str(e)}",
                 )
-                await manager.send_progress(run_id, progress.model_dump())
+                await manager.send_progress(
+                    run_id, progress.model_dump_json().encode(), flush=True
+                )
 
             finally:
                 # Clean up task reference
@@ -214,10 +258,20 @@ class EvaluationService:
         result = await self.session.execute(
             select(EvaluationRun)
             .where(EvaluationRun.id == run_id)
-            .options(selectinload(EvaluationRun.results))
+            .options(selectinload(EvaluationRun.results), raiseload("*"))
         )
         return result.scalar_one_or_none()
 
+    async def stream_results(self, run_id: UUID):
+        """Stream a run's results row by row without buffering them all."""
+        result = await self.session.stream_scalars(
+            select(EvaluationResult)
+            .where(EvaluationResult.evaluation_run_id == run_id)
+            .execution_options(yield_per=100)
+        )
+        async for row in result:
+            yield row
+
     async def list_runs(
         self,
         agent_id: Optional[UUID] = None,
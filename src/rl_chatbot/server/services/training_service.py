@@ -1,31 +1,62 @@
 """Training service for running agent training."""
 
 import asyncio
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+from collections import namedtuple
+from typing import Optional, List, Dict
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import select, func
 
+from ..config import get_settings
+from ..models._common import utcnow
 from ..models import Agent, TestCase, TrainingRun, TrainingEpisode
 from ..schemas.training import TrainingRequest, TrainingProgress
 from ..websocket.manager import manager
+from .agent_pool import agent_pool
 
 from rl_chatbot.factory import AgentFactory
 from rl_chatbot.rl.trainer import RLTrainer
 from rl_chatbot.rl.reward import RewardFunction
 
 
+# Runs beyond max_concurrent_runs queue here instead of all executing at once
+_run_slots = asyncio.Semaphore(get_settings().max_concurrent_runs)
+
+# Live-run bookkeeping is process-wide: the service is constructed per
+# request, so these must outlive the instance that started a run for
+# stop_training from a later request to find its cancel token
+_running_tasks: Dict[UUID, asyncio.Task] = {}
+_cancel_events: Dict[UUID, asyncio.Event] = {}
+
+# Episodes are committed in batches of this size; each commit is an fsync,
+# so batching cuts DB round-trips by the batch factor on long runs
+EPISODE_COMMIT_BATCH = 10
+
+# Immutable per-test-case snapshot for the rollout loop: attribute access
+# beats dict lookups over num_episodes x num_test_cases iterations
+TestCaseRunSpec = namedtuple(
+    "TestCaseRunSpec", "user_input expected_output expected_tools task_type"
+)
+
+
+def _test_case_query(test_case_ids: Optional[List[UUID]], count: bool = False):
+    """Build the active-test-case query, optionally as a COUNT."""
+    query = select(func.count()).select_from(TestCase) if count else select(TestCase)
+    query = query.where(TestCase.is_active == True)
+    if test_case_ids:
+        query = query.where(TestCase.id.in_(test_case_ids))
+    return query
+
+
 class TrainingService:
     """Service for running training."""
 
     def __init__(self, session: AsyncSession):
         self.session = session
         self._factory = AgentFactory()
-        self._running_tasks: Dict[UUID, asyncio.Task] = {}
-        self._cancelled_runs: set = set()
 
     async def start_training(self, request: TrainingRequest) -> TrainingRun:
         """Start a new training run."""
@@ -35,21 +66,15 @@ class TrainingService:
         if not agent_db:
             raise ValueError(f"Agent {request.agent_id} not found")
 
-        # Get test cases
-        if request.test_case_ids:
-            result = await self.session.execute(
-                select(TestCase).where(
-                    TestCase.id.in_(request.test_case_ids),
-                    TestCase.is_active == True,
-                )
-            )
-        else:
-            result = await self.session.execute(
-                select(TestCase).where(TestCase.is_active == True)
+        # Count matching test cases; the background runner streams the rows
+        # from its own session instead of materializing them twice
+        num_test_cases = (
+            await self.session.execute(
+                _test_case_query(request.test_case_ids, count=True)
             )
-        test_cases = list(result.scalars().all())
+        ).scalar_one()
 
-        if not test_cases:
+        if not num_test_cases:
             raise ValueError("No test cases found")
 
         # Create training run
@@ -60,7 +85,7 @@ class TrainingService:
             current_episode=0,
             config_json={
                 "reward_weights": request.reward_weights,
-                "test_case_count": len(test_cases),
+                "test_case_count": num_test_cases,
             },
         )
         self.session.add(run)
@@ -68,18 +93,23 @@ class TrainingService:
         await self.session.refresh(run)
 
         # Start background task
+        _cancel_events[run.id] = asyncio.Event()
         task = asyncio.create_task(
-            self._run_training(run.id, agent_db, test_cases, request)
+            self._run_training(run.id, agent_db, request)
         )
-        self._running_tasks[run.id] = task
+        _running_tasks[run.id] = task
 
         return run
 
     async def stop_training(self, run_id: UUID) -> bool:
-        """Stop a running training."""
-        if run_id in self._running_tasks:
-            self._cancelled_runs.add(run_id)
-            self._running_tasks[run_id].cancel()
+        """Stop a running training.
+
+        Sets the run's cancel event; the runner notices it at the next
+        episode boundary and shuts down cleanly.
+        """
+        event = _cancel_events.get(run_id)
+        if event is not None:
+            event.set()
             return True
         return False
 
@@ -87,52 +117,81 @@ class TrainingService:
         self,
         run_id: UUID,
         agent_db: Agent,
-        test_cases: List[TestCase],
         request: TrainingRequest,
     ):
         """Run training in background."""
         from ..database import async_session
 
-        async with async_session() as session:
+        async with _run_slots, async_session() as session:
+            episodes_done = 0
+            episode_buffer: List[TrainingEpisode] = []
             try:
-                # Update status to running
+                # Fetch the run once; it stays attached in the identity map,
+                # so later status updates mutate it without re-SELECTing
                 result = await session.execute(
                     select(TrainingRun).where(TrainingRun.id == run_id)
                 )
                 run = result.scalar_one()
                 run.status = "running"
-                session.add(run)
                 await session.commit()
 
-                # Create in-memory agent
-                agent = self._factory.create_agent(
-                    agent_type=agent_db.agent_type,
-                    model=agent_db.model,
-                    temperature=agent_db.temperature,
-                )
-
                 # Create reward function with custom weights if provided
                 reward_function = RewardFunction()
                 if request.reward_weights:
                     reward_function.weights = request.reward_weights
 
-                # Convert test cases to dict format
-                test_case_dicts = [
-                    {
-                        "user_input": tc.user_input,
-                        "expected_output": tc.expected_output,
-                        "expected_tools": tc.expected_tools_json or [],
-                        "task_type": tc.task_type,
-                    }
-                    for tc in test_cases
-                ]
+                # Stream test cases into immutable specs; ORM rows are
+                # released as the cursor advances instead of living for the
+                # whole run
+                rows = await session.stream_scalars(
+                    _test_case_query(request.test_case_ids).execution_options(yield_per=100)
+                )
+                specs = []
+                async for tc in rows:
+                    specs.append(
+                        TestCaseRunSpec(
+                            user_input=tc.user_input,
+                            expected_output=tc.expected_output,
+                            expected_tools=tc.expected_tools_json or [],
+                            task_type=tc.task_type,
+                        )
+                    )
+                test_case_specs = tuple(specs)
+
+                # Rollouts within an episode are independent LLM round-trips,
+                # so run them concurrently under a semaphore with a pooled
+                # agent per rollout to avoid shared conversation state
+                semaphore = asyncio.Semaphore(max(1, request.concurrency))
+
+                async def _rollout(spec: TestCaseRunSpec) -> float:
+                    async with semaphore:
+                        rollout_agent = agent_pool.acquire(
+                            agent_db.agent_type, agent_db.model, agent_db.temperature
+                        )
+                        try:
+                            await asyncio.to_thread(rollout_agent.chat, spec.user_input)
+                            return await asyncio.to_thread(
+                                reward_function.compute_reward,
+                                agent=rollout_agent,
+                                user_input=spec.user_input,
+                                expected_output=spec.expected_output,
+                                expected_tools=spec.expected_tools,
+                                task_type=spec.task_type,
+                            )
+                        finally:
+                            agent_pool.release(
+                                agent_db.agent_type, agent_db.model, agent_db.temperature,
+                                rollout_agent,
+                            )
 
                 # Run training episodes
                 total_avg_reward = 0.0
 
+                cancel_event = _cancel_events[run_id]
+
                 for episode in range(request.num_episodes):
-                    # Check for cancellation
-                    if run_id in self._cancelled_runs:
+                    # Check the cancel token at the episode boundary
+                    if cancel_event.is_set():
                         raise asyncio.CancelledError()
 
                     # Send progress update
@@ -144,48 +203,56 @@ class TrainingService:
                         progress_percent=int((episode / request.num_episodes) * 100),
                         message=f"Running episode {episode + 1}/{request.num_episodes}",
                     )
-                    await manager.send_progress(run_id, progress.model_dump())
+                    await manager.send_progress(run_id, progress.model_dump_json().encode())
 
-                    # Collect episode rewards
+                    # Collect episode rewards, streaming progress as each
+                    # rollout finishes instead of waiting for the slowest
                     episode_rewards = []
-                    for tc_dict in test_case_dicts:
-                        agent.reset()
-                        response = agent.chat(tc_dict["user_input"])
-                        tool_calls = agent.get_last_tool_calls()
-
-                        reward = reward_function.compute_reward(
-                            agent=agent,
-                            user_input=tc_dict["user_input"],
-                            expected_output=tc_dict.get("expected_output"),
-                            expected_tools=tc_dict.get("expected_tools", []),
-                            task_type=tc_dict.get("task_type", "contains"),
+                    tasks = [
+                        asyncio.create_task(_rollout(spec)) for spec in test_case_specs
+                    ]
+                    for finished in asyncio.as_completed(tasks):
+                        episode_rewards.append(await finished)
+                        progress = TrainingProgress(
+                            run_id=run_id,
+                            status="running",
+                            current_episode=episode + 1,
+                            total_episodes=request.num_episodes,
+                            progress_percent=int((episode / request.num_episodes) * 100),
+                            message=(
+                                f"Episode {episode + 1}: "
+                                f"{len(episode_rewards)}/{len(tasks)} rollouts done"
+                            ),
                         )
-                        episode_rewards.append(reward)
+                        await manager.send_progress(run_id, progress.model_dump_json().encode())
 
                     # Calculate episode metrics
                     avg_reward = sum(episode_rewards) / len(episode_rewards)
                     total_reward = sum(episode_rewards)
                     total_avg_reward += avg_reward
 
-                    # Save episode
-                    training_episode = TrainingEpisode(
-                        training_run_id=run_id,
-                        episode_num=episode,
-                        avg_reward=avg_reward,
-                        total_reward=total_reward,
-                        num_test_cases=len(test_case_dicts),
-                        rewards_json=episode_rewards,
+                    # Buffer the episode; commit in batches so long runs
+                    # don't pay one fsync per episode
+                    episode_buffer.append(
+                        TrainingEpisode(
+                            training_run_id=run_id,
+                            episode_num=episode,
+                            avg_reward=avg_reward,
+                            total_reward=total_reward,
+                            num_test_cases=len(test_case_specs),
+                            rewards_json=episode_rewards,
+                        )
                     )
-                    session.add(training_episode)
+                    episodes_done = episode + 1
 
-                    # Update run progress
-                    result = await session.execute(
-                        select(TrainingRun).where(TrainingRun.id == run_id)
-                    )
-                    run = result.scalar_one()
-                    run.current_episode = episode + 1
-                    session.add(run)
-                    await session.commit()
+                    if (
+                        len(episode_buffer) >= EPISODE_COMMIT_BATCH
+                        or episodes_done == request.num_episodes
+                    ):
+                        session.add_all(episode_buffer)
+                        run.current_episode = episodes_done
+                        await session.commit()
+                        episode_buffer.clear()
 
                     # Send progress with reward
                     progress = TrainingProgress(
@@ -197,20 +264,15 @@ class TrainingService:
                         current_avg_reward=avg_reward,
                         message=f"Episode {episode + 1} complete, avg reward: {avg_reward:.3f}",
                     )
-                    await manager.send_progress(run_id, progress.model_dump())
+                    await manager.send_progress(run_id, progress.model_dump_json().encode())
 
                 # Calculate final metrics
                 final_avg_reward = total_avg_reward / request.num_episodes
 
                 # Update run as completed
-                result = await session.execute(
-                    select(TrainingRun).where(TrainingRun.id == run_id)
-                )
-                run = result.scalar_one()
                 run.status = "completed"
-                run.completed_at = datetime.utcnow()
+                run.completed_at = utcnow()
                 run.final_avg_reward = final_avg_reward
-                session.add(run)
                 await session.commit()
 
                 # Send completion update
@@ -223,39 +285,52 @@ class TrainingService:
                     current_avg_reward=final_avg_reward,
                     message=f"Training completed, final avg reward: {final_avg_reward:.3f}",
                 )
-                await manager.send_progress(run_id, progress.model_dump())
+                await manager.send_progress(
+                    run_id, progress.model_dump_json().encode(), flush=True
+                )
 
             except asyncio.CancelledError:
-                # Update run as cancelled
-                result = await session.execute(
-                    select(TrainingRun).where(TrainingRun.id == run_id)
+                # The session may hold a half-done transaction; roll it back
+                # and mark the run with one direct UPDATE, no SELECT needed
+                await session.rollback()
+                # Episodes that finished but had not reached a batch commit
+                # were never added to the session; persist them so
+                # current_episode matches the rows in training_episodes
+                if episode_buffer:
+                    session.add_all(episode_buffer)
+                    episode_buffer = []
+                await session.execute(
+                    update(TrainingRun)
+                    .where(TrainingRun.id == run_id)
+                    .values(
+                        status="cancelled",
+                        completed_at=utcnow(),
+                        current_episode=episodes_done,
+                    )
                 )
-                run = result.scalar_one()
-                run.status = "cancelled"
-                run.completed_at = datetime.utcnow()
-                session.add(run)
                 await session.commit()
 
                 # Send cancellation update
                 progress = TrainingProgress(
                     run_id=run_id,
                     status="cancelled",
-                    current_episode=run.current_episode,
+                    current_episode=episodes_done,
                     total_episodes=request.num_episodes,
-                    progress_percent=int((run.current_episode / request.num_episodes) * 100),
+                    progress_percent=int((episodes_done / request.num_episodes) * 100),
                     message="Training cancelled",
                 )
-                await manager.send_progress(run_id, progress.model_dump())
+                await manager.send_progress(
+                    run_id, progress.model_dump_json().encode(), flush=True
+                )
 
             except Exception as e:
-                # Update run as failed
-                result = await session.execute(
-                    select(TrainingRun).where(TrainingRun.id == run_id)
+                # Mark the run failed with one direct UPDATE, no SELECT needed
+                await session.rollback()
+                await session.execute(
+                    update(TrainingRun)
+                    .where(TrainingRun.id == run_id)
+                    .values(status="failed", completed_at=utcnow())
                 )
-                run = result.scalar_one()
-                run.status = "failed"
-                run.completed_at = datetime.utcnow()
-                session.add(run)
                 await session.commit()
 
                 # Send failure update
@@ -267,23 +342,35 @@ class TrainingService:
                     progress_percent=0,
                     message=f"Training failed: {str(e)}",
                 )
-                await manager.send_progress(run_id, progress.model_dump())
+                await manager.send_progress(
+                    run_id, progress.model_dump_json().encode(), flush=True
+                )
 
             finally:
                 # Clean up
-                if run_id in self._running_tasks:
-                    del self._running_tasks[run_id]
-                self._cancelled_runs.discard(run_id)
+                _running_tasks.pop(run_id, None)
+                _cancel_events.pop(run_id, None)
 
     async def get_run(self, run_id: UUID) -> Optional[TrainingRun]:
         """Get a training run with episodes."""
         result = await self.session.execute(
             select(TrainingRun)
             .where(TrainingRun.id == run_id)
-            .options(selectinload(TrainingRun.episodes))
+            .options(selectinload(TrainingRun.episodes), raiseload("*"))
         )
         return result.scalar_one_or_none()
 
+    async def stream_episodes(self, run_id: UUID):
+        """Stream a run's episodes row by row without buffering them all."""
+        result = await self.session.stream_scalars(
+            select(TrainingEpisode)
+            .where(TrainingEpisode.training_run_id == run_id)
+            .order_by(TrainingEpisode.episode_num)
+            .execution_options(yield_per=100)
+        )
+        async for row in result:
+            yield row
+
     async def list_runs(
         self,
         agent_id: Optional[UUID] = None,
@@ -1,23 +1,38 @@
 """WebSocket chat handler."""
 
-import json
 from typing import Optional
 from uuid import UUID
 
+import orjson
+
 from fastapi import WebSocket, WebSocketDisconnect
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..schemas.chat import ChatRequest
-from ..services.chat_service import ChatService
+from ..database import async_session
+from ..schemas.chat import InternalChatRequest
 from .manager import manager
 
+# The ack never changes; serialize it once instead of per inbound message
+_ACK_FRAME = orjson.dumps({"type": "ack", "status": "processing"})
+
 
 class ChatWebSocketHandler:
-    """Handles WebSocket chat connections."""
+    """Handles WebSocket chat connections.
+
+    Sessions are acquired per message rather than per connection, so an
+    idle WebSocket client does not pin a DB connection from the pool.
+    """
+
+    # ChatService pulls in the agent/LLM import chain; resolve it on first
+    # use instead of at module import and cache the factory on the class
+    _service_factory = None
 
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.service = ChatService(session)
+    @classmethod
+    def _get_service(cls):
+        if cls._service_factory is None:
+            from ..services.chat_service import get_chat_service
+
+            cls._service_factory = get_chat_service
+        return cls._service_factory()
 
     async def handle(
         self,
@@ -31,45 +46,57 @@ class ChatWebSocketHandler:
 
         try:
             while True:
-                # Receive message from client
-                data = await websocket.receive_text()
+                # Receive the raw frame: binary frames feed orjson directly
+                # with no per-frame UTF-8 decode, text frames fall through
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code") or 1000)
+                data = message.get("bytes")
+                if data is None:
+                    data = message.get("text", "")
 
                 try:
-                    message_data = json.loads(data)
-                except json.JSONDecodeError:
-                    message_data = {"message": data}
-
-                # Extract message content
-                message_content = message_data.get("message", data)
+                    message_data = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    message_data = None
+
+                # Extract message content; non-JSON input is the message
+                if isinstance(message_data, dict) and "message" in message_data:
+                    message_content = message_data["message"]
+                elif isinstance(data, bytes):
+                    message_content = data.decode("utf-8", "replace")
+                else:
+                    message_content = data
 
                 # Send acknowledgment
-                await websocket.send_json({
-                    "type": "ack",
-                    "status": "processing",
-                })
+                await websocket.send_bytes(_ACK_FRAME)
 
                 try:
-                    # Process chat request
-                    request = ChatRequest(
+                    # Process chat request; agent_id and conversation_id
+                    # are already valid UUIDs, so skip Pydantic validation
+                    request = InternalChatRequest(
                         agent_id=agent_id,
                         message=message_content,
                         conversation_id=current_conversation_id,
                     )
 
-                    response = await self.service.chat(request)
+                    async with async_session() as session:
+                        service = self._get_service()
+                        response = await service.chat(session, request)
 
                     # Update conversation ID for subsequent messages
                     current_conversation_id = response.conversation_id
 
-                    # Send response
-                    await websocket.send_json({
+                    # Send response; orjson renders UUIDs natively, so no
+                    # str() casts are needed
+                    await websocket.send_bytes(orjson.dumps({
                         "type": "response",
-                        "conversation_id": str(response.conversation_id),
-                        "message_id": str(response.message_id),
+                        "conversation_id": response.conversation_id,
+                        "message_id": response.message_id,
                         "response": response.response,
                         "tool_calls": [
                             {
-                                "id": str(tc.id),
+                                "id": tc.id,
                                 "tool_name": tc.tool_name,
                                 "arguments": tc.arguments_json,
                                 "result": tc.result,
@@ -77,13 +104,12 @@ class ChatWebSocketHandler:
                             for tc in response.tool_calls
                         ],
                         "sequence_num": response.sequence_num,
-                    })
+                    }))
 
                 except Exception as e:
-                    await websocket.send_json({
-                        "type": "error",
-                        "error": str(e),
-                    })
+                    await websocket.send_bytes(
+                        orjson.dumps({"type": "error", "error": str(e)})
+                    )
 
         except WebSocketDisconnect:
             manager.disconnect_agent(websocket, agent_id)
@@ -1,81 +1,147 @@
 """WebSocket connection manager."""
 
-from typing import Dict, List, Set
+import asyncio
+from collections import defaultdict
+from typing import Dict, List
 from uuid import UUID
 
+import orjson
 from fastapi import WebSocket
 
+# Coalescing window for throttled progress updates: within it, only the
+# most recent frame per run is kept and flushed once the timer fires
+PROGRESS_FLUSH_INTERVAL = 0.15
+
 
 class ConnectionManager:
     """Manages WebSocket connections."""
 
     def __init__(self):
-        # Map of agent_id to set of connected WebSockets
-        self._agent_connections: Dict[UUID, Set[WebSocket]] = {}
-        # Map of run_id to set of connected WebSockets (for progress updates)
-        self._progress_connections: Dict[UUID, Set[WebSocket]] = {}
+        # Map of agent_id to connected WebSockets. A list beats a set for
+        # the typical handful of sockets per agent: cheaper iteration on
+        # every broadcast, and membership is only checked on connect.
+        self._agent_connections: Dict[UUID, List[WebSocket]] = defaultdict(list)
+        # Map of run_id to per-connection progress queues. Producers enqueue
+        # updates without blocking; each connection's handler drains its queue
+        # and batches ready updates into a single frame.
+        self._progress_connections: Dict[UUID, Dict[WebSocket, asyncio.Queue]] = defaultdict(
+            dict
+        )
+        # Latest throttled frame and pending flush timer per run
+        self._latest_progress: Dict[UUID, bytes] = {}
+        self._flush_tasks: Dict[UUID, asyncio.Task] = {}
 
     async def connect_agent(self, websocket: WebSocket, agent_id: UUID):
         """Connect a WebSocket for agent chat."""
         await websocket.accept()
-        if agent_id not in self._agent_connections:
-            self._agent_connections[agent_id] = set()
-        self._agent_connections[agent_id].add(websocket)
+        connections = self._agent_connections[agent_id]
+        if websocket not in connections:
+            connections.append(websocket)
 
     def disconnect_agent(self, websocket: WebSocket, agent_id: UUID):
         """Disconnect a WebSocket from agent chat."""
-        if agent_id in self._agent_connections:
-            self._agent_connections[agent_id].discard(websocket)
-            if not self._agent_connections[agent_id]:
+        connections = self._agent_connections.get(agent_id)
+        if connections is not None:
+            try:
+                connections.remove(websocket)
+            except ValueError:
+                pass
+            if not connections:
                 del self._agent_connections[agent_id]
 
-    async def connect_progress(self, websocket: WebSocket, run_id: UUID):
-        """Connect a WebSocket for progress updates."""
+    async def connect_progress(self, websocket: WebSocket, run_id: UUID) -> asyncio.Queue:
+        """Connect a WebSocket for progress updates.
+
+        Returns the queue the connection's handler should drain.
+        """
         await websocket.accept()
-        if run_id not in self._progress_connections:
-            self._progress_connections[run_id] = set()
-        self._progress_connections[run_id].add(websocket)
+        queue: asyncio.Queue = asyncio.Queue()
+        self._progress_connections[run_id][websocket] = queue
+        return queue
 
     def disconnect_progress(self, websocket: WebSocket, run_id: UUID):
         """Disconnect a WebSocket from progress updates."""
         if run_id in self._progress_connections:
-            self._progress_connections[run_id].discard(websocket)
+            self._progress_connections[run_id].pop(websocket, None)
             if not self._progress_connections[run_id]:
                 del self._progress_connections[run_id]
 
     async def send_to_agent(self, agent_id: UUID, message: dict):
-        """Send a message to all connections for an agent."""
-        if agent_id in self._agent_connections:
-            disconnected = []
-            for connection in self._agent_connections[agent_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    disconnected.append(connection)
-            # Clean up disconnected connections
-            for conn in disconnected:
-                self._agent_connections[agent_id].discard(conn)
-
-    async def send_progress(self, run_id: UUID, message: dict):
-        """Send a progress update to all connections for a run."""
-        if run_id in self._progress_connections:
-            disconnected = []
-            for connection in self._progress_connections[run_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    disconnected.append(connection)
-            # Clean up disconnected connections
-            for conn in disconnected:
-                self._progress_connections[run_id].discard(conn)
+        """Send a message to all connections for an agent.
+
+        Sends run concurrently so one slow peer cannot stall delivery to
+        the rest; failed connections are dropped afterwards. The payload
+        is serialized once and the sockets share the bytes.
+        """
+        # Immutable snapshot: the live list can change while the sends are
+        # awaited, but the tuple keeps iteration and the zip below aligned
+        targets = tuple(self._agent_connections.get(agent_id, ()))
+        if targets:
+            payload = orjson.dumps(message)
+            results = await asyncio.gather(
+                *(conn.send_bytes(payload) for conn in targets),
+                return_exceptions=True,
+            )
+            failed = [
+                conn
+                for conn, result in zip(targets, results)
+                if isinstance(result, Exception)
+            ]
+            # Rebuild in one pass rather than removing one by one
+            if failed:
+                self._agent_connections[agent_id] = [
+                    conn
+                    for conn in self._agent_connections.get(agent_id, [])
+                    if conn not in failed
+                ]
+
+    async def send_progress(self, run_id: UUID, message: bytes, flush: bool = False):
+        """Queue a pre-serialized progress update for a run's connections.
+
+        Callers serialize the frame once; fanning out bytes means the cost
+        does not scale with the number of connected clients.
+
+        By default updates coalesce: within PROGRESS_FLUSH_INTERVAL only
+        the most recent frame is delivered, so tight per-rollout loops
+        can't flood the sockets. Pass ``flush=True`` for status
+        transitions that must go out immediately and never be dropped.
+        """
+        if run_id not in self._progress_connections:
+            return
+
+        if flush:
+            # A terminal/transition frame supersedes anything pending
+            task = self._flush_tasks.pop(run_id, None)
+            if task is not None:
+                task.cancel()
+            self._latest_progress.pop(run_id, None)
+            self._dispatch_progress(run_id, message)
+            return
+
+        self._latest_progress[run_id] = message
+        if run_id not in self._flush_tasks:
+            self._flush_tasks[run_id] = asyncio.create_task(self._flush_progress(run_id))
+
+    def _dispatch_progress(self, run_id: UUID, message: bytes):
+        """Fan a frame out to every queue listening on a run."""
+        for queue in self._progress_connections.get(run_id, {}).values():
+            queue.put_nowait(message)
+
+    async def _flush_progress(self, run_id: UUID):
+        """Deliver the newest coalesced frame after the throttle window."""
+        await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+        self._flush_tasks.pop(run_id, None)
+        message = self._latest_progress.pop(run_id, None)
+        if message is not None:
+            self._dispatch_progress(run_id, message)
 
     def get_agent_connection_count(self, agent_id: UUID) -> int:
         """Get number of connections for an agent."""
-        return len(self._agent_connections.get(agent_id, set()))
+        return len(self._agent_connections.get(agent_id, ()))
 
     def get_progress_connection_count(self, run_id: UUID) -> int:
         """Get number of connections for a run."""
-        return len(self._progress_connections.get(run_id, set()))
+        return len(self._progress_connections.get(run_id, {}))
 
 
 # Global connection manager singleton
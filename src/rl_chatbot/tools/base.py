@@ -1,19 +1,25 @@
 """Base classes for tool definitions"""
 
-from typing import Any, Dict, List, Callable
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Callable, Mapping, Optional
 
+import orjson
 
-class Tool(BaseModel):
-    """Represents a tool that the chatbot can call"""
 
-    name: str = Field(..., description="Name of the tool")
-    description: str = Field(..., description="Description of what the tool does")
-    parameters: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="JSON schema for tool parameters"
-    )
-    function: Callable = Field(..., description="The actual function to call")
+@dataclass(slots=True, frozen=True)
+class Tool:
+    """Represents a tool that the chatbot can call.
+
+    A frozen slotted dataclass rather than a pydantic model: tools are
+    built once at startup from trusted code, so validation buys nothing,
+    while slots make attribute access on the dispatch path a C lookup.
+    """
+
+    name: str
+    description: str
+    function: Callable
+    parameters: Dict[str, Any] = field(default_factory=dict)
 
     def execute(self, **kwargs) -> Any:
         """Execute the tool with given parameters"""
@@ -25,29 +31,62 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
+        # Schemas are requested on every LLM turn but tools are registered
+        # once, so the built list (and its serialized form) is memoized and
+        # invalidated only on registration
+        self._schemas_cache: Optional[List[Dict[str, Any]]] = None
+        self._schemas_bytes: Optional[bytes] = None
 
     def register(self, tool: Tool):
         """Register a tool"""
         self._tools[tool.name] = tool
+        self._schemas_cache = None
+        self._schemas_bytes = None
+
+    @property
+    def tools(self) -> Mapping[str, Tool]:
+        """Read-only view of the registered tools for direct subscription."""
+        return MappingProxyType(self._tools)
 
     def get(self, name: str) -> Tool:
-        """Get a tool by name"""
+        """Get a tool by name; raises KeyError if not registered"""
+        return self._tools[name]
+
+    def get_or_none(self, name: str) -> Optional[Tool]:
+        """Get a tool by name, or None if not registered"""
         return self._tools.get(name)
 
+    def contains(self, name: str) -> bool:
+        """Check whether a tool is registered"""
+        return name in self._tools
+
     def list_tools(self) -> List[Tool]:
         """List all registered tools"""
         return list(self._tools.values())
 
     def get_tool_schemas(self) -> List[Dict[str, Any]]:
         """Get JSON schemas for all tools (for LLM function calling)"""
-        schemas = []
-        for tool in self._tools.values():
-            schemas.append({
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.parameters
-                }
-            })
-        return schemas
+        if self._schemas_cache is None:
+            schemas = []
+            for tool in self._tools.values():
+                schemas.append({
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": tool.parameters
+                    }
+                })
+            self._schemas_cache = schemas
+            self._schemas_bytes = orjson.dumps(schemas)
+        return self._schemas_cache
+
+    def get_tool_schemas_json(self) -> bytes:
+        """Get the tool schemas pre-serialized as JSON bytes.
+
+        Callers that would otherwise re-encode get_tool_schemas() can send
+        these bytes directly, skipping the dict-to-JSON roundtrip per call.
+        """
+        if self._schemas_bytes is None:
+            self.get_tool_schemas()
+        return self._schemas_bytes
@@ -1,21 +1,43 @@
 """Mathematical calculation tool"""
 
+from functools import lru_cache
+
 from .base import Tool
 
+# Deleting every legal byte must leave nothing behind; bytes.translate
+# runs as a single C table scan instead of per-character dict lookups
+_ALLOWED_BYTES = b"0123456789+-*/.() "
 
-def calculate(expression: str) -> str:
-    """Calculate a mathematical expression safely"""
+
+
+@lru_cache(maxsize=4096)
+def _calc_cached(expression: str) -> str:
+    """Validate and evaluate an expression, memoized per input string.
+
+    Agents tend to repeat the same expressions; caching skips the
+    reparse/compile/eval on every repeat.
+    """
     try:
-        # Only allow basic math operations for safety
-        allowed_chars = set("0123456789+-*/.() ")
-        if not all(c in allowed_chars for c in expression):
+        # Only allow basic math operations for safety; non-ASCII input is
+        # rejected outright so the byte-level scan can't miss anything
+        if not expression.isascii() or expression.encode("ascii").translate(
+            None, _ALLOWED_BYTES
+        ):
             return "Error: Invalid characters in expression"
-        result = eval(expression)
+        code = compile(expression, "<calc>", "eval")
+        result = eval(code)
         return str(result)
     except Exception as e:
         return f"Error: {str(e)}"
 
 
+def calculate(expression: str) -> str:
+    """Calculate a mathematical expression safely"""
+    # Only trim the ends: interior whitespace is significant to the parser
+    # ("1 2" must stay a syntax error, not become "12")
+    return _calc_cached(expression.strip())
+
+
 def create_calculate_tool() -> Tool:
     """Create the calculate tool"""
     return Tool(
@@ -36,6 +36,57 @@ def test_tool_registry():
     assert len(registry.list_tools()) == 1
 
 
+def test_registry_lookup_api():
+    """Test the registry lookup variants"""
+    registry = ToolRegistry()
+    tool = Tool(
+        name="test",
+        description="Test",
+        parameters={},
+        function=lambda: "test"
+    )
+    registry.register(tool)
+
+    assert registry.get_or_none("test") == tool
+    assert registry.get_or_none("missing") is None
+    assert registry.contains("test")
+    assert not registry.contains("missing")
+    assert registry.tools["test"] == tool
+
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+def test_registry_schema_cache():
+    """Test that schemas are cached and invalidated on registration"""
+    registry = ToolRegistry()
+    registry.register(Tool(
+        name="first",
+        description="First",
+        parameters={},
+        function=lambda: "first"
+    ))
+
+    schemas = registry.get_tool_schemas()
+    assert registry.get_tool_schemas() is schemas  # memoized
+    assert schemas[0]["function"]["name"] == "first"
+
+    schemas_json = registry.get_tool_schemas_json()
+    assert isinstance(schemas_json, bytes)
+    assert b"first" in schemas_json
+
+    # Registering a new tool invalidates both caches
+    registry.register(Tool(
+        name="second",
+        description="Second",
+        parameters={},
+        function=lambda: "second"
+    ))
+    schemas = registry.get_tool_schemas()
+    assert [s["function"]["name"] for s in schemas] == ["first", "second"]
+    assert b"second" in registry.get_tool_schemas_json()
+
+
 def test_default_tool_registry():
     """Test default tool registry creation"""
     registry = create_default_tool_registry()
@@ -60,3 +111,13 @@ def test_calculate_tool():
     result = calc_tool.execute(expression="10 * 5")
     assert result == "50"
 
+
+def test_calculate_rejects_bad_input():
+    """Test calculate tool error handling"""
+    registry = create_default_tool_registry()
+    calc_tool = registry.get("calculate")
+
+    assert calc_tool.execute(expression="import os").startswith("Error:")
+    assert calc_tool.execute(expression="1 2").startswith("Error:")
+    assert calc_tool.execute(expression="café + 1").startswith("Error:")
+